@@ -6,74 +6,221 @@ This script verifies that all required dependencies are installed and working.
 Run this after installation to ensure everything is set up correctly.
 """
 
+import argparse
+import hashlib
+import json
 import subprocess
 import sys
 import os
+import shutil
 import importlib
+import importlib.metadata
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def check_python_version():
     """Check Python version requirement"""
     print("Checking Python version...")
     version = sys.version_info
-    if version >= (3, 7):
-        print(f"   Python {version.major}.{version.minor}.{version.micro} (>= 3.7 required) OK")
+    if version >= (3, 10):
+        print(f"   Python {version.major}.{version.minor}.{version.micro} (>= 3.10 required) OK")
         return True
     else:
-        print(f"   Python {version.major}.{version.minor}.{version.micro} (< 3.7, please upgrade) ERROR")
+        print(f"   Python {version.major}.{version.minor}.{version.micro} (< 3.10, please upgrade) ERROR")
         return False
 
+def _package_version(dist_names):
+    """
+    Read an installed package's version from distribution metadata, without
+    importing it. dist_names lists the distributions that can provide the
+    package (e.g. the opencv-python variants); the first one found is used.
+    """
+    for dist_name in dist_names:
+        try:
+            return importlib.metadata.version(dist_name)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return 'unknown'
+
+def _pkg_config_version(*modules):
+    """
+    Ask pkg-config for the version of the first of the given library modules
+    it knows about. Returns 'unknown' if pkg-config or the modules are missing.
+    """
+    pkg_config = shutil.which('pkg-config')
+    if pkg_config is None:
+        return 'unknown'
+    for module in modules:
+        try:
+            result = subprocess.run([pkg_config, '--modversion', module],
+                                    capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            return 'unknown'
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    return 'unknown'
+
 def check_python_packages():
     """Check required Python packages"""
     print("\nChecking Python packages...")
     
+    # (import name, display name, distribution names). Presence is tested with
+    # find_spec and versions come from package metadata, so none of these
+    # (often slow to import) packages is actually imported. The import name
+    # and distribution name differ for some (PIL/Pillow, cv2/opencv-python).
     required_packages = [
-        ('PIL', 'Pillow'),
-        ('numpy', 'NumPy'),
-        ('cv2', 'opencv-python'),
+        ('PIL', 'Pillow', ('Pillow', 'Pillow-SIMD')),
+        ('numpy', 'NumPy', ('numpy',)),
+        ('cv2', 'opencv-python', ('opencv-python', 'opencv-python-headless',
+                                  'opencv-contrib-python', 'opencv-contrib-python-headless')),
     ]
     
     optional_packages = [
-        ('scipy', 'SciPy'),
+        ('scipy', 'SciPy', ('scipy',)),
+        ('numba', 'Numba', ('numba',)),
     ]
     
     all_good = True
     
     # Check required packages
-    for package, name in required_packages:
-        try:
-            module = importlib.import_module(package)
-            version = module.__version__ if hasattr(module, '__version__') else 'unknown'
-            
-            # Special check for NumPy version compatibility with vhs-decode
-            if package == 'numpy':
-                try:
-                    major_version = int(version.split('.')[0])
-                    if major_version >= 2:
-                        print(f"   {name} {version} WARNING (vhs-decode requires NumPy 1.x)")
-                        print(f"      Current NumPy 2.x may cause vhs-decode to fail")
-                        print(f"      Fix with: pip install 'numpy<2.0'")
-                    else:
-                        print(f"   {name} {version} OK")
-                except (ValueError, AttributeError):
-                    print(f"   {name} {version} OK")
-            else:
-                print(f"   {name} {version} OK")
-        except ImportError:
+    for package, name, dist_names in required_packages:
+        if importlib.util.find_spec(package) is None:
             print(f"   {name} ERROR (install with: pip install {name})")
             all_good = False
+            continue
+        
+        version = _package_version(dist_names)
+        if version == 'unknown' and package == 'cv2':
+            # Conda builds of OpenCV ship no Python distribution metadata;
+            # ask pkg-config rather than importing cv2 (which loads the
+            # native library and NumPy)
+            version = _pkg_config_version('opencv4', 'opencv')
+        
+        # Special check for NumPy version compatibility with vhs-decode
+        if package == 'numpy':
+            try:
+                major_version = int(version.split('.')[0])
+                if major_version >= 2:
+                    print(f"   {name} {version} WARNING (vhs-decode requires NumPy 1.x)")
+                    print(f"      Current NumPy 2.x may cause vhs-decode to fail")
+                    print(f"      Fix with: pip install 'numpy<2.0'")
+                else:
+                    print(f"   {name} {version} OK")
+            except (ValueError, AttributeError):
+                print(f"   {name} {version} OK")
+        else:
+            print(f"   {name} {version} OK")
     
     # Check optional packages
-    for package, name in optional_packages:
-        try:
-            module = importlib.import_module(package)
-            version = module.__version__ if hasattr(module, '__version__') else 'unknown'
-            print(f"   {name} {version} (optional) OK")
-        except ImportError:
+    for package, name, dist_names in optional_packages:
+        if importlib.util.find_spec(package) is None:
             print(f"   {name} (optional - install with: pip install {name})")
+        else:
+            print(f"   {name} {_package_version(dist_names)} (optional) OK")
     
     return all_good
 
+# Successful probe results are cached here, keyed on the probed binary's path,
+# size and modification time, so unchanged tools are not re-run on every check.
+# Failures are never cached, so a fixed install is picked up straight away.
+PROBE_CACHE_DIR = Path.home() / '.cache' / 'ddd-capture-toolkit' / 'probes'
+
+# Set to False (--no-cache) to force every probe to run
+use_probe_cache = True
+
+# '--version' on a native tool answers immediately; anything slower is hung.
+# The Python-based decoders get longer because interpreter start-up and
+# their imports can take several seconds on a cold cache.
+PROBE_TIMEOUT = 2
+PYTHON_TOOL_PROBE_TIMEOUT = 10
+
+def _probe_cache_file(cmd):
+    """Return the cache file for a resolved probe command, or None if caching is off"""
+    if not use_probe_cache:
+        return None
+    try:
+        st = os.stat(cmd[0])
+    except OSError:
+        return None
+    stamp = json.dumps([cmd, st.st_mtime_ns, st.st_size])
+    return PROBE_CACHE_DIR / f"{hashlib.sha1(stamp.encode()).hexdigest()}.json"
+
+def _probe(argv, timeout, cache=True):
+    """
+    Run a single command probe (e.g. '--version').
+    Returns the CompletedProcess, or the exception raised if it could not run.
+    Only the first line of stdout and stderr is kept, since that is all the
+    report shows.
+    Commands that are not on PATH are reported as FileNotFoundError without
+    spawning anything, and results for unchanged binaries come from the
+    probe cache. Pass cache=False for tools whose health does not show in
+    their own file (e.g. Python entry-point scripts, which break when the
+    packages they import change).
+    """
+    resolved = shutil.which(argv[0])
+    if resolved is None:
+        return FileNotFoundError(f"{argv[0]} not found")
+    
+    cmd = [resolved] + list(argv[1:])
+    cache_file = _probe_cache_file(cmd) if cache else None
+    if cache_file is not None:
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            return subprocess.CompletedProcess(cmd, cached['returncode'],
+                                               cached['stdout'], cached['stderr'])
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    try:
+        result = subprocess.run(cmd,
+                                stdin=subprocess.DEVNULL,
+                                capture_output=True,
+                                timeout=timeout)
+    except Exception as e:
+        return e
+    
+    # Decode just the first line rather than whole help/banner dumps
+    result.stdout, result.stderr = (
+        stream.split(b'\n', 1)[0].decode('utf-8', 'replace').rstrip('\r')
+        for stream in (result.stdout, result.stderr)
+    )
+    
+    if cache_file is not None and result.returncode == 0:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump({'returncode': result.returncode,
+                           'stdout': result.stdout,
+                           'stderr': result.stderr}, f)
+        except OSError:
+            pass
+    
+    return result
+
+def _detect_platform_commands():
+    """Return the platform-specific commands to probe, as {command: description}"""
+    try:
+        from platform_utils import detector
+        is_windows, is_macos = detector.is_windows, detector.is_macos
+    except ImportError:
+        # Fallback if platform_utils not available
+        is_windows, is_macos = sys.platform == 'win32', sys.platform == 'darwin'
+    
+    if is_windows:
+        # Windows-specific tools
+        return {'powershell': 'PowerShell (for screenshots and system integration)'}
+    elif is_macos:
+        # macOS-specific tools
+        return {'screencapture': 'screencapture (for screenshots)'}
+    else:
+        # Linux/Unix tools
+        return {'mono': 'Mono .NET runtime (for VHS audio alignment, optional)'}
+
+# The platform cannot change while we run, so work this out once
+_PLATFORM_COMMANDS = _detect_platform_commands()
+
 def check_system_commands():
     """Check required system commands"""
     print("\n Checking system commands...")
@@ -81,7 +228,8 @@ def check_system_commands():
     commands = {
         'sox': 'SOX (audio processing)',
         'ffmpeg': 'FFmpeg (video processing)',
-        sys.executable: 'Python (current executable)',
+        # Add platform-specific tools
+        **_PLATFORM_COMMANDS,
     }
     
     # Add vhs-decode check (critical for RF decoding)
@@ -90,157 +238,115 @@ def check_system_commands():
         str(Path.home() / '.local/bin/vhs-decode'),  # User local install
     ]
     
+    # Add ld-decode check (critical for LaserDisc RF decoding). ld-analyse is
+    # the canonical binary; the others only matter for installs without it,
+    # and finding the first one present is a PATH lookup, not a process.
+    ld_decode_tools = ['ld-analyse', 'ld-chroma-decoder', 'ld-dropout-correct']
+    ld_tool = next((tool for tool in ld_decode_tools if shutil.which(tool)), None)
+    
+    # The probes are independent, so run them all at once and report the
+    # results afterwards in the usual order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # vhs-decode and tbc-video-export are small Python launcher scripts
+        # that stay the same when their environment (e.g. NumPy) changes, so
+        # they are always probed afresh
+        vhs_probes = [(vhs_path, executor.submit(_probe, [vhs_path, '--help'],
+                                                      PYTHON_TOOL_PROBE_TIMEOUT, False))
+                      for vhs_path in vhs_decode_paths]
+        ld_probe = executor.submit(_probe, [ld_tool, '--version'], PROBE_TIMEOUT) if ld_tool else None
+        tbc_probe = executor.submit(_probe, ['tbc-video-export', '--version'],
+                                    PYTHON_TOOL_PROBE_TIMEOUT, False)
+        command_probes = [(cmd, description, executor.submit(_probe, [cmd, '--version'], PROBE_TIMEOUT))
+                          for cmd, description in commands.items()]
+        # KDE Spectacle is an optional screenshot tool on Linux; it does not
+        # affect the overall result
+        spectacle_probe = None
+        if sys.platform not in ('win32', 'darwin'):
+            spectacle_probe = executor.submit(_probe, ['spectacle', '--help'], 5)
+    
     vhs_decode_found = False
-    for vhs_path in vhs_decode_paths:
-        try:
-            result = subprocess.run([vhs_path, '--help'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=10)
-            if result.returncode == 0:
-                print(f"    vhs-decode (VHS RF decoder) - found at {vhs_path}")
-                vhs_decode_found = True
-                break
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            continue
-        except Exception:
+    for vhs_path, probe in vhs_probes:
+        result = probe.result()
+        if isinstance(result, Exception):
             continue
+        if result.returncode == 0:
+            print(f"    vhs-decode (VHS RF decoder) - found at {vhs_path}")
+            vhs_decode_found = True
+            break
     
     if not vhs_decode_found:
         print(f"    vhs-decode (VHS RF decoder) - not found")
         print(f"      Install with: pip install vhs-decode")
         print(f"      Or check ~/.local/bin is in PATH")
     
-    # Add platform-specific tools
-    try:
-        from platform_utils import detector
-        if detector.is_windows:
-            # Windows-specific tools
-            commands['powershell'] = 'PowerShell (for screenshots and system integration)'
-        elif detector.is_macos:
-            # macOS-specific tools
-            commands['screencapture'] = 'screencapture (for screenshots)'
-        else:
-            # Linux/Unix tools
-            commands['mono'] = 'Mono .NET runtime (for VHS audio alignment, optional)'
-    except ImportError:
-        # Fallback if platform_utils not available
-        if sys.platform == 'win32':
-            commands['powershell'] = 'PowerShell (for screenshots and system integration)'
-        elif sys.platform == 'darwin':
-            commands['screencapture'] = 'screencapture (for screenshots)'
-        else:
-            commands['mono'] = 'Mono .NET runtime (for VHS audio alignment, optional)'
-    
-    # Add ld-decode check (critical for LaserDisc RF decoding)
-    ld_decode_tools = ['ld-analyse', 'ld-chroma-decoder', 'ld-dropout-correct']
     ld_decode_found = False
-    for tool in ld_decode_tools:
-        try:
-            result = subprocess.run([tool, '--version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=5)
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0] if result.stdout else result.stderr.split('\n')[0]
-                print(f"    {tool} (LaserDisc RF decoder) - {version_line} OK")
-                ld_decode_found = True
-                break
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-            continue
+    if ld_probe is not None:
+        result = ld_probe.result()
+        if not isinstance(result, Exception) and result.returncode == 0:
+            version_line = result.stdout.split('\n')[0] if result.stdout else result.stderr.split('\n')[0]
+            print(f"    {ld_tool} (LaserDisc RF decoder) - {version_line} OK")
+            ld_decode_found = True
     
     if not ld_decode_found:
         print(f"    ld-decode (LaserDisc RF decoder) - not found")
         print(f"      Install following instructions at: https://github.com/happycube/ld-decode")
     
     # Add tbc-video-export check (critical for TBC to video conversion)
-    try:
-        result = subprocess.run(['tbc-video-export', '--version'], 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=10)
-        if result.returncode == 0:
-            version_line = result.stdout.split('\n')[0] if result.stdout else 'version info unavailable'
-            print(f"    tbc-video-export (TBC to video converter) - {version_line} OK")
-        else:
-            print(f"    tbc-video-export (TBC to video converter) - command failed")
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    result = tbc_probe.result()
+    if isinstance(result, (FileNotFoundError, subprocess.TimeoutExpired)):
         print(f"    tbc-video-export (TBC to video converter) - not found")
         print(f"      Install with: pip install tbc-video-export")
-    except Exception as e:
-        print(f"    tbc-video-export (TBC to video converter) - error: {e}")
+    elif isinstance(result, Exception):
+        print(f"    tbc-video-export (TBC to video converter) - error: {result}")
+    elif result.returncode == 0:
+        version_line = result.stdout.split('\n')[0] if result.stdout else 'version info unavailable'
+        print(f"    tbc-video-export (TBC to video converter) - {version_line} OK")
+    else:
+        print(f"    tbc-video-export (TBC to video converter) - command failed")
     
     all_good = True
     
-    for cmd, description in commands.items():
-        try:
-            result = subprocess.run([cmd, '--version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=5)
-            # Some commands return non-zero exit codes but still work (like FFmpeg)
-            # Check if we got meaningful output regardless of exit code
-            has_output = bool(result.stdout.strip() or result.stderr.strip())
-            success_codes = [0] if cmd != 'ffmpeg' else [0, 8]  # FFmpeg returns 8 for --version
-            
-            if result.returncode in success_codes or (has_output and 'version' in result.stdout.lower()):
-                # Get version from output
-                version_line = result.stdout.split('\n')[0] if result.stdout else result.stderr.split('\n')[0]
-                print(f"    {description} - {version_line} OK")
-            else:
-                print(f"    {description} - command failed (exit code {result.returncode})")
-                all_good = False
-        except subprocess.TimeoutExpired:
+    # We are running in the current interpreter, so there is nothing to probe
+    print(f"    Python (current executable) - Python {sys.version.split()[0]} OK")
+    
+    for cmd, description, probe in command_probes:
+        result = probe.result()
+        if isinstance(result, subprocess.TimeoutExpired):
             print(f"    {description} - command timeout")
             all_good = False
-        except FileNotFoundError:
+            continue
+        elif isinstance(result, FileNotFoundError):
             print(f"    {description} - not found in PATH")
             all_good = False
-        except Exception as e:
-            print(f"    {description} - error: {e}")
+            continue
+        elif isinstance(result, Exception):
+            print(f"    {description} - error: {result}")
+            all_good = False
+            continue
+        
+        # Some commands return non-zero exit codes but still work (like FFmpeg)
+        # Check if we got meaningful output regardless of exit code
+        has_output = bool(result.stdout.strip() or result.stderr.strip())
+        success_codes = [0] if cmd != 'ffmpeg' else [0, 8]  # FFmpeg returns 8 for --version
+        
+        if result.returncode in success_codes or (has_output and 'version' in result.stdout.lower()):
+            # Get version from output
+            version_line = result.stdout.split('\n')[0] if result.stdout else result.stderr.split('\n')[0]
+            print(f"    {description} - {version_line} OK")
+        else:
+            print(f"    {description} - command failed (exit code {result.returncode})")
             all_good = False
     
-    return all_good
-
-def check_platform_specific():
-    """Check platform-specific requirements"""
-    print(f"\n  Checking platform-specific features ({sys.platform})...")
-    
-    if sys.platform == 'win32':
-        # Windows - check PowerShell
-        try:
-            result = subprocess.run(['powershell', '-Command', 'Get-Host'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                print("    PowerShell available (for screenshots)")
-            else:
-                print("    PowerShell not working")
-        except:
-            print("    PowerShell not available")
-    
-    elif sys.platform == 'darwin':
-        # macOS - check screencapture
-        try:
-            result = subprocess.run(['screencapture', '-h'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode in [0, 1]:  # screencapture returns 1 for help
-                print("    screencapture available")
-            else:
-                print("    screencapture not working")
-        except:
-            print("    screencapture not available")
-    
-    else:
-        # Linux - check spectacle (optional)
-        try:
-            result = subprocess.run(['spectacle', '--help'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                print("    KDE Spectacle available")
-            else:
-                print("     KDE Spectacle not working (install with: sudo apt install spectacle)")
-        except:
+    if spectacle_probe is not None:
+        result = spectacle_probe.result()
+        if isinstance(result, Exception):
             print("     KDE Spectacle not found (install with: sudo apt install spectacle)")
+        elif result.returncode == 0:
+            print("    KDE Spectacle available")
+        else:
+            print("     KDE Spectacle not working (install with: sudo apt install spectacle)")
+    
+    return all_good
 
 def check_vhs_audio_tools():
     """Check VHS audio alignment tools"""
@@ -256,8 +362,12 @@ def check_vhs_audio_tools():
     
     found_tool = False
     for path in possible_paths:
-        if os.path.exists(path):
-            size = os.path.getsize(path) / (1024*1024)  # MB
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        else:
+            size = st.st_size / (1024*1024)  # MB
             print(f"    VhsDecodeAutoAudioAlign.exe found ({size:.1f} MB) at {path}")
             found_tool = True
             break
@@ -275,8 +385,16 @@ def check_vhs_audio_tools():
         print(f"    VHS audio alignment wrapper script missing")
 
 
-def main():
+def main(argv=None):
     """Main dependency check routine"""
+    global use_probe_cache
+    
+    parser = argparse.ArgumentParser(description="Check DdD Sync Capture dependencies")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="re-run every tool probe instead of reusing cached results")
+    args = parser.parse_args(argv)
+    use_probe_cache = not args.no_cache
+    
     print("DdD Sync Capture - Dependency Checker")
     print("=" * 50)
     
@@ -286,7 +404,6 @@ def main():
         check_system_commands(),
     ]
     
-    check_platform_specific()
     check_vhs_audio_tools()
     
     print("\n" + "=" * 50)
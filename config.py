@@ -6,9 +6,14 @@ Handles loading, saving, and managing configuration settings including
 capture directory location and other user preferences.
 """
 
+import copy
 import json
 import os
-import sys
+import shutil
+import stat
+import threading
+import types
+from contextlib import contextmanager
 from pathlib import Path
 
 # Default configuration values
@@ -24,72 +29,162 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Read-only view of the defaults, handed out by read-only accessors
+_DEFAULT_VIEW = types.MappingProxyType(DEFAULT_CONFIG)
+
 CONFIG_FILE = "config.json"
 
+# Valid FFmpeg thread counts: 0 = auto, 1-16 = specific
+_VALID_FFMPEG_THREADS = frozenset(range(17))
+
+# Parsed config.json, keyed on the file's (mtime_ns, size) so it is only
+# re-read after the file changes. Shared by the UI and worker threads.
+_CONFIG_CACHE = {"stamp": None, "data": None}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Absolute capture directory already resolved for the configured
+# capture_directory value; it is only reused while it still exists
+_CAPTURE_DIR_CACHE = {"key": None, "path": None}
+
 def get_project_root():
     """Get the project root directory (where this script is located)"""
     return Path(__file__).parent.resolve()
 
-def load_config():
+def _with_defaults(config):
     """
-    Load configuration from config.json file.
-    Returns default config if file doesn't exist or is invalid.
+    Return config with any missing keys filled in from DEFAULT_CONFIG,
+    including missing keys inside performance_settings.
+    """
+    merged = DEFAULT_CONFIG | config
+    # The union is shallow, so merge the nested settings and give the result
+    # its own dict rather than sharing DEFAULT_CONFIG's
+    merged['performance_settings'] = (DEFAULT_CONFIG['performance_settings']
+                                      | (config.get('performance_settings') or {}))
+    return merged
+
+def _cache_config(stamp, config):
+    """Record config as the cached contents for stamp (config must not be shared)"""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE["stamp"] = stamp
+        _CONFIG_CACHE["data"] = config
+
+def _load_config_shared():
+    """
+    Return the parsed config.json, re-reading it only if the file changed.
+    Returns DEFAULT_CONFIG if the file doesn't exist or is invalid.
+    The returned dict is shared and must not be modified.
     """
     config_path = get_project_root() / CONFIG_FILE
     
     try:
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                
-            # Ensure all default keys exist (for backwards compatibility)
-            for key, default_value in DEFAULT_CONFIG.items():
-                if key not in config:
-                    config[key] = default_value
-                    
-            return config
-        else:
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
             # First time - create default config
-            return DEFAULT_CONFIG.copy()
+            return DEFAULT_CONFIG
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _CONFIG_CACHE_LOCK:
+            if _CONFIG_CACHE["stamp"] == stamp:
+                return _CONFIG_CACHE["data"]
+        
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+            
+        # Ensure all default keys exist (for backwards compatibility)
+        config = _with_defaults(config)
+        _cache_config(stamp, config)
+                
+        return config
             
     except (json.JSONDecodeError, IOError) as e:
         print(f"Warning: Could not load config file: {e}")
         print("Using default configuration.")
-        return DEFAULT_CONFIG.copy()
+        return DEFAULT_CONFIG
+
+def load_config():
+    """
+    Load configuration from config.json file.
+    Returns default config if file doesn't exist or is invalid.
+    The parsed file is cached until it changes on disk; callers always get
+    their own copy, so they may modify it freely.
+    """
+    return copy.deepcopy(_load_config_shared())
+
+def _read_config():
+    """
+    Read-only variant of load_config for accessors that only look settings
+    up: returns a view of the cached config without copying it.
+    """
+    config = _load_config_shared()
+    return _DEFAULT_VIEW if config is DEFAULT_CONFIG else types.MappingProxyType(config)
 
 def save_config(config):
     """
     Save configuration to config.json file.
+    The file is written to a temporary file and renamed into place, so a
+    crash never leaves a half-written config behind.
     Returns True if successful, False otherwise.
     """
     config_path = get_project_root() / CONFIG_FILE
+    tmp_path = config_path.with_suffix('.tmp')
     
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=4)
-        return True
-    except IOError as e:
+        tmp_path.write_text(json.dumps(config, indent=4))
+        os.replace(tmp_path, config_path)
+    except (IOError, TypeError, ValueError) as e:
         print(f"Error: Could not save config file: {e}")
         return False
+    
+    # Keep the cache in step with what was just written
+    try:
+        st = os.stat(config_path)
+        _cache_config((st.st_mtime_ns, st.st_size), _with_defaults(copy.deepcopy(config)))
+    except OSError:
+        _cache_config(None, None)
+    return True
+
+@contextmanager
+def config_transaction():
+    """
+    Load the configuration once, let the caller change any number of
+    settings on the yielded dict, and save it once when the block exits.
+    Nothing is saved if the block raises. Raises IOError if saving fails
+    (save_config has already reported why).
+    """
+    config = load_config()
+    yield config
+    if not save_config(config):
+        raise IOError("Could not save config file")
 
 def get_capture_directory():
     """
     Get the current capture directory as an absolute path.
     Creates the directory if it doesn't exist.
     """
-    config = load_config()
+    config = _read_config()
     capture_dir = config.get("capture_directory", "temp")
     
+    cache_key = capture_dir
+    if _CAPTURE_DIR_CACHE["key"] == cache_key and os.path.isdir(_CAPTURE_DIR_CACHE["path"]):
+        return _CAPTURE_DIR_CACHE["path"]
+    
     # Convert relative paths to absolute (relative to project root)
     if not os.path.isabs(capture_dir):
-        capture_dir = get_project_root() / capture_dir
-    else:
-        capture_dir = Path(capture_dir)
+        capture_dir = os.path.join(get_project_root(), capture_dir)
+    capture_dir = os.path.normpath(capture_dir)
     
     # Create directory if it doesn't exist
     try:
-        capture_dir.mkdir(parents=True, exist_ok=True)
-        return str(capture_dir)
+        try:
+            is_dir = stat.S_ISDIR(os.stat(capture_dir).st_mode)
+        except FileNotFoundError:
+            is_dir = False
+        if not is_dir:
+            os.makedirs(capture_dir, exist_ok=True)
+        _CAPTURE_DIR_CACHE["key"] = cache_key
+        _CAPTURE_DIR_CACHE["path"] = capture_dir
+        return capture_dir
     except OSError as e:
         print(f"Warning: Could not create capture directory {capture_dir}: {e}")
         # Fall back to temp directory in project root
@@ -121,14 +216,15 @@ def set_capture_directory(new_directory):
             return False
         
         # Update configuration
-        config = load_config()
-        config["capture_directory"] = str(new_path)
-        
-        if save_config(config):
-            print(f"Capture directory updated to: {new_path}")
-            return True
-        else:
+        try:
+            with config_transaction() as config:
+                config["capture_directory"] = str(new_path)
+        except IOError:
             return False
+        
+        _CAPTURE_DIR_CACHE["key"] = None
+        print(f"Capture directory updated to: {new_path}")
+        return True
             
     except Exception as e:
         print(f"Error setting capture directory: {e}")
@@ -140,14 +236,10 @@ def check_disk_space(directory, required_gb=10):
     Returns (available_gb, has_enough_space)
     """
     try:
-        if sys.platform == 'win32':
-            import shutil
-            total, used, free = shutil.disk_usage(directory)
-            free_gb = free / (1024**3)
-        else:
-            # Unix/Linux
-            statvfs = os.statvfs(directory)
-            free_gb = (statvfs.f_frsize * statvfs.f_bavail) / (1024**3)
+        # shutil.disk_usage reports space available to the current user on
+        # every platform (statvfs f_bavail on Unix)
+        total, used, free = shutil.disk_usage(directory)
+        free_gb = free / (1024**3)
         
         return free_gb, free_gb >= required_gb
         
@@ -160,17 +252,24 @@ def get_ffmpeg_threads():
     Get the configured FFmpeg thread count for performance control.
     Returns an integer between 0-16, where 0 means auto-detect.
     """
-    config = load_config()
+    config = _read_config()
     perf_settings = config.get('performance_settings', {})
     threads = perf_settings.get('ffmpeg_threads', 4)  # Default to 4 threads
     
-    # Validate thread count (0 = auto, 1-16 = specific)
-    if isinstance(threads, int) and 0 <= threads <= 16:
+    # Validate thread count (0 = auto, 1-16 = specific). The isinstance check
+    # keeps e.g. 4.0 from a hand-edited config.json from matching the set.
+    if isinstance(threads, int) and threads in _VALID_FFMPEG_THREADS:
         return threads
     else:
         # Invalid value, return default
         return 4
 
+def get_audio_delay():
+    """
+    Get the configured audio delay in seconds (0.000 if not set).
+    """
+    return _read_config().get('audio_delay', 0.000)
+
 def set_ffmpeg_threads(thread_count):
     """
     Set the FFmpeg thread count for performance control.
@@ -178,26 +277,25 @@ def set_ffmpeg_threads(thread_count):
     Returns True if successful, False otherwise.
     """
     # Validate input
-    if not isinstance(thread_count, int) or not (0 <= thread_count <= 16):
+    if not isinstance(thread_count, int) or thread_count not in _VALID_FFMPEG_THREADS:
         print(f"Error: FFmpeg thread count must be between 0-16 (got {thread_count})")
         return False
     
     try:
-        config = load_config()
-        
-        # Ensure performance_settings exists
-        if 'performance_settings' not in config:
-            config['performance_settings'] = {}
-        
-        # Update thread count
-        config['performance_settings']['ffmpeg_threads'] = thread_count
-        
-        if save_config(config):
-            threads_desc = "auto-detect" if thread_count == 0 else f"{thread_count} threads"
-            print(f"FFmpeg thread count updated to: {threads_desc}")
-            return True
-        else:
+        try:
+            with config_transaction() as config:
+                # Ensure performance_settings exists
+                if 'performance_settings' not in config:
+                    config['performance_settings'] = {}
+                
+                # Update thread count
+                config['performance_settings']['ffmpeg_threads'] = thread_count
+        except IOError:
             return False
+        
+        threads_desc = "auto-detect" if thread_count == 0 else f"{thread_count} threads"
+        print(f"FFmpeg thread count updated to: {threads_desc}")
+        return True
             
     except Exception as e:
         print(f"Error setting FFmpeg thread count: {e}")
@@ -207,7 +305,7 @@ def get_performance_summary():
     """
     Get a formatted summary of current performance settings.
     """
-    config = load_config()
+    config = _read_config()
     perf_settings = config.get('performance_settings', {})
     
     ffmpeg_threads = get_ffmpeg_threads()
@@ -226,7 +324,7 @@ def get_performance_summary():
 
 def get_config_summary():
     """Get a formatted summary of current configuration"""
-    config = load_config()
+    config = _read_config()
     capture_dir = get_capture_directory()
     
     # Check disk space
@@ -1,4 +1,105 @@
 
+def _graceful_stop(ddd_process):
+    """
+    Stop a running DomesdayDuplicator capture.
+    Sends the stop command without waiting on it and gives the process 30
+    seconds to shut down by itself, so it can write its JSON. After that it
+    is terminated, and killed if it still has not exited 5 seconds later.
+    Nothing here blocks on the stop command itself, so the output pump keeps
+    draining the pipe throughout.
+    """
+    try:
+        # Send the stop command - this creates the stop file that DomesdayDuplicator watches for
+        stop_process = subprocess.Popen(['DomesdayDuplicator', '--stop-capture'],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        print(f"[Video Thread] Stop command failed ({e}). Falling back to process termination.")
+        stop_process = None
+    else:
+        print("[Video Thread] Stop command sent. Waiting for DomesdayDuplicator to complete shutdown...")
+    
+    if stop_process is not None:
+        # Wait for the process to exit naturally (this allows JSON generation),
+        # giving up early if the stop command reports a failure
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                ddd_process.wait(timeout=0.5)
+            except subprocess.TimeoutExpired:
+                if stop_process.poll() not in (None, 0):
+                    print(f"[Video Thread] Stop command failed (exit code {stop_process.returncode}). Falling back to process termination.")
+                    break
+            else:
+                print("[Video Thread] DomesdayDuplicator completed shutdown naturally.")
+                break
+        else:
+            print("[Video Thread] DomesdayDuplicator did not exit within 30 seconds. Terminating process...")
+        
+        if stop_process.poll() is None:
+            stop_process.kill()
+        stop_process.wait()
+    
+    if ddd_process.poll() is None:
+        ddd_process.terminate()
+        try:
+            ddd_process.wait(timeout=5)
+            print("[Video Thread] DomesdayDuplicator process terminated.")
+        except subprocess.TimeoutExpired:
+            print("[Video Thread] Process did not respond to terminate. Killing process...")
+            ddd_process.kill()
+            ddd_process.wait()
+            print("[Video Thread] DomesdayDuplicator process killed.")
+
+def _wait_for_enter(stop_event):
+    """
+    Block until the user presses Enter or stop_event is set, whichever
+    comes first. Returns True if Enter was pressed. stop_event is set on
+    return either way.
+    Windows cannot wait on the console and a pipe together, so there this
+    is a plain input().
+    """
+    if sys.platform == 'win32':
+        input()
+        stop_event.set()
+        return True
+    
+    # A worker setting the event writes to this pipe, so one select() wakes
+    # on whichever happens first
+    wake_r, wake_w = os.pipe()
+    
+    def _wake():
+        stop_event.wait()
+        os.write(wake_w, b'\0')
+    
+    waker = threading.Thread(target=_wake, daemon=True)
+    waker.start()
+    try:
+        with selectors.DefaultSelector() as sel:
+            sel.register(sys.stdin, selectors.EVENT_READ)
+            sel.register(wake_r, selectors.EVENT_READ)
+            ready = {key.fileobj for key, _ in sel.select()}
+        if sys.stdin in ready:
+            sys.stdin.readline()
+            return True
+        return False
+    finally:
+        stop_event.set()
+        waker.join()
+        os.close(wake_r)
+        os.close(wake_w)
+
+# The last stretch of the audio delay is spun rather than slept, because a
+# sleeping thread can be woken a scheduler tick late
+_SPIN_SECONDS = 0.002
+
+def _sleep_until(deadline):
+    """Sleep until time.monotonic() reaches deadline"""
+    remaining = deadline - time.monotonic()
+    if remaining > _SPIN_SECONDS:
+        time.sleep(remaining - _SPIN_SECONDS)
+    while time.monotonic() < deadline:
+        pass
+
 def shared_capture_process(sox_command, audio_delay, capture_duration, ddd_command=None):
     """
     A shared function to start video and audio capture in parallel threads.
@@ -19,10 +120,11 @@ def shared_capture_process(sox_command, audio_delay, capture_duration, ddd_comma
         print("[Video Thread] Starting DomesdayDuplicator capture...")
         print(f"[Video Thread] Command: {' '.join(ddd_command)}")
         try:
-            # Start DomesdayDuplicator with real-time output monitoring
+            # Start DomesdayDuplicator with real-time output monitoring. The
+            # pipe is read as raw bytes, so whatever is waiting in it is
+            # pulled in with a single read.
             ddd_process = subprocess.Popen(ddd_command, 
-                                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                         text=True, bufsize=1, universal_newlines=True)
+                                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
             print("[Video Thread] DomesdayDuplicator process started.")
             
             # Give the process a moment to start 
@@ -33,70 +135,61 @@ def shared_capture_process(sox_command, audio_delay, capture_duration, ddd_comma
                 print(f"[Video Thread] ERROR: DomesdayDuplicator failed to start!")
                 print(f"[Video Thread] Return code: {ddd_process.returncode}")
                 if stdout:
-                    print(f"[Video Thread] Output: {stdout.strip()}")
+                    print(f"[Video Thread] Output: {stdout.decode('utf-8', 'replace').strip()}")
+                stop_event.set()
                 return
             
             print("[Video Thread] DomesdayDuplicator is running successfully")
             print("[Video Thread] --- DomesdayDuplicator Status ---")
             
-            # Monitor DomesdayDuplicator output in real-time until stop is requested
-            import select
-            while not stop_event.is_set() and ddd_process.poll() is None:
-                # Use select to check if there's output available (non-blocking)
-                ready, _, _ = select.select([ddd_process.stdout], [], [], 0.1)
-                if ready:
-                    line = ddd_process.stdout.readline()
-                    if line:
-                        # Prefix DomesdayDuplicator output and display immediately
-                        print(f"[DD] {line.rstrip()}", flush=True)
-                else:
-                    # Short sleep to prevent excessive CPU usage
-                    time.sleep(0.1)
+            # Relay DomesdayDuplicator output from a separate thread. The
+            # blocking read only wakes up when there is output, and the loop
+            # ends on EOF once the process has exited. Complete lines are
+            # decoded and written once per read rather than once per line.
+            pump_thread = threading.Thread(target=_stream_subprocess,
+                                           args=(ddd_process, '[DD] '), daemon=True)
+            pump_thread.start()
+            
+            # DomesdayDuplicator exiting by itself means there is no more
+            # video, so a watchdog turns that into a stop request - which also
+            # wakes the main thread and stops SOX; otherwise just block until
+            # we are told to stop
+            def _watch_ddd():
+                ddd_process.wait()
+                stop_event.set()
+            
+            threading.Thread(target=_watch_ddd, daemon=True).start()
+            stop_event.wait()
             print("[Video Thread] Stopping DomesdayDuplicator capture using file-based method...")
             
-            # Send the stop command - this creates the stop file that DomesdayDuplicator watches for
-            stop_result = subprocess.run(['DomesdayDuplicator', '--stop-capture'], 
-                                       capture_output=True, text=True, timeout=10)
+            _graceful_stop(ddd_process)
             
-            if stop_result.returncode == 0:
-                print("[Video Thread] Stop command sent successfully. Waiting for DomesdayDuplicator to complete shutdown...")
-                
-                # Wait for the process to exit naturally (this allows JSON generation)
-                try:
-                    ddd_process.wait(timeout=30)  # Give it 30 seconds to complete shutdown
-                    print("[Video Thread] DomesdayDuplicator completed shutdown naturally.")
-                except subprocess.TimeoutExpired:
-                    print("[Video Thread] DomesdayDuplicator did not exit within 30 seconds. Terminating process...")
-                    ddd_process.terminate()
-                    try:
-                        ddd_process.wait(timeout=5)
-                        print("[Video Thread] DomesdayDuplicator process terminated.")
-                    except subprocess.TimeoutExpired:
-                        print("[Video Thread] Process did not respond to terminate. Killing process...")
-                        ddd_process.kill()
-                        ddd_process.wait()
-                        print("[Video Thread] DomesdayDuplicator process killed.")
-            else:
-                print(f"[Video Thread] Stop command failed (exit code {stop_result.returncode}). Falling back to process termination.")
-                ddd_process.terminate()
-                ddd_process.wait()
+            # The process has exited, so the pump sees EOF and finishes
+            # printing whatever output was left in the pipe
+            pump_thread.join(timeout=5)
+            if not pump_thread.is_alive():
+                ddd_process.stdout.close()
             
             print("[Video Thread] DomesdayDuplicator capture stopped.")
             
         except Exception as e:
             print(f"[Video Thread] Exception starting DomesdayDuplicator: {e}")
+            stop_event.set()
 
     def audio_capture_thread():
-        time.sleep(audio_delay)
+        _sleep_until(audio_start)
         # Start SOX with direct console output (preserves VU meters)
         sox_process = subprocess.Popen(sox_command)
         
-        # Monitor SOX process status without interfering with its output
-        start_time = time.time()
-        while not stop_event.is_set() and sox_process.poll() is None:
-            # Wait for stop event or check every 60 seconds
-            if stop_event.wait(timeout=60):
-                break  # Stop event was set
+        # SOX exiting by itself means there is nothing left to record, so a
+        # watchdog turns that into a stop request; otherwise just block until
+        # we are told to stop
+        def _watch_sox():
+            sox_process.wait()
+            stop_event.set()
+        
+        threading.Thread(target=_watch_sox, daemon=True).start()
+        stop_event.wait()
         
         sox_process.terminate()
         sox_process.wait()
@@ -105,18 +198,28 @@ def shared_capture_process(sox_command, audio_delay, capture_duration, ddd_comma
     video_thread = threading.Thread(target=video_capture_thread)
     audio_thread = threading.Thread(target=audio_capture_thread)
 
+    # The audio delay is measured from the moment the video thread is
+    # started, not from whenever the audio thread gets scheduled
+    audio_start = time.monotonic() + audio_delay
     video_thread.start()
     audio_thread.start()
 
     # Wait for the appropriate stop condition
     if capture_duration is not None:
         print(f"[Main Thread] Capture in progress for {capture_duration} seconds...")
-        time.sleep(capture_duration)
-        print("[Main Thread] Capture duration elapsed. Signaling threads to stop...")
+        # The watchdogs on DomesdayDuplicator and SOX set the stop event if
+        # either process exits (and the video thread does if it cannot
+        # start), which ends the wait early
+        if stop_event.wait(timeout=capture_duration):
+            print("[Main Thread] A capture process stopped early. Signaling threads to stop...")
+        else:
+            print("[Main Thread] Capture duration elapsed. Signaling threads to stop...")
     else:
         print(f"[Main Thread] Capture in progress. \033[92mPress Enter to stop...\033[0m")
-        input()  # Wait for user to press Enter
-        print("[Main Thread] User requested stop. Signaling threads to stop...")
+        if _wait_for_enter(stop_event):
+            print("[Main Thread] User requested stop. Signaling threads to stop...")
+        else:
+            print("[Main Thread] A capture process stopped early. Signaling threads to stop...")
 
     # Signal the threads to stop
     stop_event.set()
@@ -153,6 +256,8 @@ import subprocess
 import time
 import sys
 import os
+import functools
+import selectors
 import threading
 
 # Force unbuffered output for real-time console display
@@ -174,9 +279,11 @@ sys.stderr.reconfigure(line_buffering=True)
 CAPTURE_NAME = 'my_vhs_capture'  # Default fallback
 
 # Import configuration management
-from config import get_capture_directory, load_config, save_config
+from config import get_audio_delay, get_capture_directory, load_config, save_config
 
-# Get actual temp folder for calibration (always uses project temp directory)
+# Get actual temp folder for calibration (always uses project temp directory).
+# The location never changes, so it is only worked out (and created) once.
+@functools.lru_cache(maxsize=1)
 def get_temp_folder():
     """Get the temp folder in project directory for calibration/alignment files"""
     project_root = os.path.dirname(os.path.abspath(__file__))
@@ -190,45 +297,64 @@ def get_capture_folder():
     """Get the configured capture directory for user captures"""
     return get_capture_directory()
 
+def _stat_or_none(path):
+    """Return os.stat(path), or None if the path cannot be stat'ed (e.g. it doesn't exist)"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def _newest_entry(folder, matches):
+    """
+    Return the os.DirEntry of the most recently modified file in folder whose
+    name satisfies matches(name), or None if there is none. The entry keeps
+    the stat result it was compared by, so entry.stat() costs no further syscall.
+    """
+    with os.scandir(folder) as it:
+        return max((entry for entry in it if matches(entry.name)),
+                   key=lambda entry: entry.stat().st_mtime, default=None)
+
+def _newest_file(folder, matches):
+    """
+    Return the path of the most recently modified file in folder whose name
+    satisfies matches(name), or None if there is none.
+    """
+    newest = _newest_entry(folder, matches)
+    return newest.path if newest else None
+
 # 3. SOX Command:
 #    This is your audio recording command. The script will replace
 #    'your_capture_name.flac' with the filename defined above.
 #    Platform-specific audio settings are configured below.
 
+# The audio driver and device only depend on the platform, so the input side
+# of the command is fixed at import
+if sys.platform == 'win32':
+    # Windows - use DirectSound or WaveIn
+    _SOX_INPUT_ARGS = (
+        '-t', 'waveaudio',      # Windows audio driver
+        '-r', '78125',
+        '-b', '24',
+        'default',              # Default audio device
+    )
+else:
+    # Linux/macOS - use ALSA (Linux) or coreaudio (macOS). On Linux use the
+    # custom ALSA device with larger buffers (see ~/.asoundrc); this prevents
+    # audio overruns during long captures at 78.125kHz
+    _SOX_DRIVER, _SOX_DEVICE = (('coreaudio', 'default') if sys.platform == 'darwin'
+                                else ('alsa', 'cxadc_buffered'))
+    _SOX_INPUT_ARGS = (
+        '-t', _SOX_DRIVER,
+        '-r', '78125',          # Input sample rate
+        '-b', '24',             # Input bit depth  
+        '-c', '2',              # Input channels
+        _SOX_DEVICE,
+        '--buffer', '8192',     # SOX internal buffer size (bytes)
+    )
+
 def get_sox_command(output_filename):
     """Get platform-specific SOX command with optimised buffer settings"""
-    if sys.platform == 'win32':
-        # Windows - use DirectSound or WaveIn
-        return [
-            'sox',
-            '-t', 'waveaudio',  # Windows audio driver
-            '-r', '78125',
-            '-b', '24',
-            'default',  # Default audio device
-            output_filename,
-            'remix', '1', '2'
-        ]
-    else:
-        # Linux/macOS - use ALSA (Linux) or coreaudio (macOS)
-        audio_driver = 'coreaudio' if sys.platform == 'darwin' else 'alsa'
-        if sys.platform == 'darwin':
-            device = 'default'
-        else:
-            # Linux ALSA - use custom ALSA device with larger buffers (see ~/.asoundrc)
-            # This prevents audio overruns during long captures at 78.125kHz
-            device = 'cxadc_buffered'
-        
-        return [
-            'sox',
-            '-t', audio_driver,
-            '-r', '78125',          # Input sample rate
-            '-b', '24',             # Input bit depth  
-            '-c', '2',              # Input channels
-            device,
-            '--buffer', '8192',     # SOX internal buffer size (bytes)
-            output_filename,
-            'remix', '1', '2'
-        ]
+    return ['sox', *_SOX_INPUT_ARGS, output_filename, 'remix', '1', '2']
 
 # Create capture file paths in temp folder
 CAPTURE_FLAC_PATH = os.path.join(get_temp_folder(), f'{CAPTURE_NAME}.flac')
@@ -236,12 +362,21 @@ CAPTURE_WAV_PATH = os.path.join(get_temp_folder(), f'{CAPTURE_NAME}.wav')
 SOX_COMMAND = get_sox_command(CAPTURE_FLAC_PATH)
 # --- SCRIPT LOGIC ---
 
+import io
+import re
+import signal
 import tempfile
 import shutil
 from analyze_test_pattern import analyze_test_pattern_timing
 from datetime import datetime
 import json
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # Generate automated alignment filename with date/time
 def get_alignment_filename():
     """Generate automated alignment filename with current date and time"""
@@ -363,7 +498,6 @@ def perform_av_alignment():
             # 1. Start audio capture using command line with zero delay as baseline
             print("Starting SOX audio recording (calibration baseline with 0.0s delay)...")
             time.sleep(0.0)  # Calibration baseline - zero delay
-            alignment_sox_command = get_sox_command(alignment_capture_filename)
             capture_process = subprocess.Popen(alignment_sox_command)
             print("SOX audio recording started")
 
@@ -385,10 +519,22 @@ def perform_av_alignment():
                 print("  (Recommended: 30-60 seconds for good calibration)")
                 print("=" * 50)
                 
-                # Wait for user to press ENTER to stop capture
+                # Wait for user to press ENTER to stop capture, or for either
+                # capture process to exit on its own
+                stop_event = threading.Event()
+                
+                def _watch(process):
+                    process.wait()
+                    stop_event.set()
+                
+                for process in (capture_process, ddd_process):
+                    threading.Thread(target=_watch, args=(process,), daemon=True).start()
+                
                 try:
-                    input()  # Wait for ENTER key
-                    print("\nStopping capture...")
+                    if _wait_for_enter(stop_event):
+                        print("\nStopping capture...")
+                    else:
+                        print("\nWARNING: A capture process exited early! Stopping capture...")
                     
                     # Stop SOX audio recording
                     print("Stopping audio recording...")
@@ -482,15 +628,13 @@ def perform_av_alignment():
             print("Please ensure the DomesdayDuplicator output location is configured correctly.")
             return
             
-        lds_files = [f for f in os.listdir(temp_folder) if f.endswith('.lds')]
-        if not lds_files:
+        # Get the most recent RF file (with full path)
+        rf_file = _newest_file(temp_folder, lambda name: name.endswith('.lds'))
+        if rf_file is None:
             print(f"No RF capture files (.lds) found in {temp_folder}!")
             print("Please ensure the Domesday Duplicator created an RF capture file in the temp folder.")
             return
         
-        # Get the most recent RF file (with full path)
-        lds_paths = [os.path.join(temp_folder, f) for f in lds_files]
-        rf_file = max(lds_paths, key=os.path.getmtime)
         print(f"Found RF capture: {rf_file}")
         
         # Check if we already have decoded files
@@ -501,7 +645,7 @@ def perform_av_alignment():
             print(f"TBC JSON already exists: {tbc_json_file}")
         else:
             print("\nRunning vhs-decode...")
-            if not run_vhs_decode_with_params(rf_file, tbc_file, 'pal', 'SP'):
+            if not run_vhs_decode_with_params(rf_file, tbc_file, 'pal', 'SP', cleanup_stale=True):
                 print("RF decode failed")
                 return
         
@@ -523,12 +667,13 @@ def perform_av_alignment():
         print("(This eliminates alignment-induced measurement errors)")
         
         # Check if captured audio file exists
-        if os.path.exists(alignment_capture_filename):
+        st = _stat_or_none(alignment_capture_filename)
+        if st is not None:
             print(f"\nUsing raw audio file: {alignment_capture_filename}")
             
             # Show file details for verification
-            file_size = os.path.getsize(alignment_capture_filename) / (1024*1024)  # MB
-            file_time = time.ctime(os.path.getmtime(alignment_capture_filename))
+            file_size = st.st_size / (1024*1024)  # MB
+            file_time = time.ctime(st.st_mtime)
             print(f"   File size: {file_size:.1f} MB")
             print(f"   Modified: {file_time}")
             
@@ -546,8 +691,7 @@ def perform_av_alignment():
                 print(f"   Baseline reference: 0.000s (no GUI delay)")
                 
                 # Read current delay from configuration for comparison
-                config = load_config()
-                current_delay = config.get('audio_delay', 0.000)
+                current_delay = get_audio_delay()
                 
                 # Direct measurement - no hardcoded delays
                 # The measured offset directly represents the timing difference
@@ -639,30 +783,110 @@ def perform_av_alignment():
         print(f"\nERROR during A/V Alignment: {e}")
 
 
+def _helper_path(command):
+    """
+    Return the full path of a short-lived helper command (falling back to the
+    bare name). These helpers are run with close_fds=False and an absolute
+    path, which lets subprocess start them with posix_spawn rather than
+    fork + close every fd + exec.
+    """
+    return check_command_available(command) or command
+
+def _command_lines():
+    """
+    Yield (pid, command line) for every other running process, reading the
+    process table through psutil, or /proc on Linux.
+    """
+    own_pid = os.getpid()
+    if PSUTIL_AVAILABLE:
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            cmdline = proc.info['cmdline']
+            if cmdline and proc.info['pid'] != own_pid:
+                yield proc.info['pid'], ' '.join(cmdline)
+        return
+    
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit() or int(entry.name) == own_pid:
+            continue
+        try:
+            with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            continue  # Exited, or not ours to read
+        if cmdline:
+            yield int(entry.name), cmdline.rstrip(b'\0').replace(b'\0', b' ').decode('utf-8', 'replace')
+
+def _find_processes(*patterns):
+    """
+    Return, for each regular expression pattern, the PIDs of running
+    processes whose full command line matches it, like 'pgrep -f'. All the
+    patterns are checked in a single pass over the process table; pgrep is
+    only run where the table cannot be read directly.
+    """
+    if not (PSUTIL_AVAILABLE or sys.platform.startswith('linux')):
+        found = []
+        for pattern in patterns:
+            result = subprocess.run([_helper_path('pgrep'), '-f', pattern],
+                                    capture_output=True, text=True, close_fds=False)
+            found.append([int(pid) for pid in result.stdout.split()] if result.returncode == 0 else [])
+        return found
+    
+    regexes = [re.compile(pattern) for pattern in patterns]
+    found = [[] for _ in patterns]
+    for pid, cmdline in _command_lines():
+        for regex, pids in zip(regexes, found):
+            if regex.search(cmdline):
+                pids.append(pid)
+    return found
+
+def _terminate_process(pid):
+    """
+    Ask a process to terminate, killing it if it is still alive 2 seconds
+    later (psutil only). Returns True if it is gone or was signalled.
+    """
+    if not PSUTIL_AVAILABLE:
+        try:
+            os.kill(int(pid), signal.SIGTERM)
+            return True
+        except ProcessLookupError:
+            return True
+        except (PermissionError, ValueError):
+            return False
+    
+    try:
+        proc = psutil.Process(pid)
+        proc.terminate()
+        try:
+            proc.wait(timeout=2)
+        except psutil.TimeoutExpired:
+            proc.kill()
+        return True
+    except psutil.NoSuchProcess:
+        return True
+    except psutil.Error:
+        return False
+
 def cleanup_existing_processes():
     """
     Check for and clean up any existing vhs-decode or DomesdayDuplicator processes
     that might interfere with new captures
     """
     try:
+        vhs_decode_pids, ddd_pids = _find_processes('vhs-decode', 'DomesdayDuplicator.*capture')
+        
         # Check for running vhs-decode processes
-        result = subprocess.run(['pgrep', '-f', 'vhs-decode'], capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
+        pids = vhs_decode_pids
+        if pids:
             print(f"\nFound {len(pids)} running vhs-decode process(es)")
             for pid in pids:
-                if pid.strip():
-                    print(f"   Terminating vhs-decode process (PID: {pid})")
-                    try:
-                        subprocess.run(['kill', pid.strip()], check=True)
-                    except subprocess.CalledProcessError:
-                        print(f"   Warning: Could not terminate process {pid}")
+                print(f"   Terminating vhs-decode process (PID: {pid})")
+                if not _terminate_process(pid):
+                    print(f"   Warning: Could not terminate process {pid}")
             print("   Cleanup completed")
         
         # Check for running DomesdayDuplicator processes (but don't kill them automatically)
-        result = subprocess.run(['pgrep', '-f', 'DomesdayDuplicator.*capture'], capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
+        pids = ddd_pids
+        if pids:
             print(f"\nWarning: Found {len(pids)} running DomesdayDuplicator capture process(es)")
             print("   These may interfere with new captures")
             print("   Consider stopping them manually or use 'Stop Current Capture' menu option")
@@ -670,258 +894,129 @@ def cleanup_existing_processes():
     except Exception as e:
         print(f"Process cleanup warning: {e}")
 
+# Commands already found on PATH. Only hits are remembered, so a tool that
+# is installed (or added to PATH) while the program runs is picked up on
+# the next check.
+_COMMAND_PATHS = {}
+
 def check_command_available(command_name):
     """
     Check if a command is available in the system PATH
     Returns the full path if found, None otherwise
+    
+    This is a plain PATH lookup (no 'which'/'where' process); paths that
+    were found are remembered, misses are looked up again each time.
     """
-    try:
-        result = subprocess.run(['which', command_name], capture_output=True, text=True)
-        if result.returncode == 0:
-            return result.stdout.strip()
-        
-        # Try 'where' on Windows
-        if sys.platform == 'win32':
-            result = subprocess.run(['where', command_name], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]  # Get first match
-        
-        return None
-    except Exception:
-        return None
+    path = _COMMAND_PATHS.get(command_name)
+    if path is None:
+        path = shutil.which(command_name)
+        if path is not None:
+            _COMMAND_PATHS[command_name] = path
+    return path
 
 
-def run_vhs_decode(rf_filename, tbc_filename, additional_params=None):
+def _relay_pipe(pipe, prefix, skip, observe=None):
     """
-    Run vhs-decode with PAL settings on the RF capture file
-    Returns True if successful, False otherwise
-    
-    Args:
-        rf_filename: Input RF (.lds) file path
-        tbc_filename: Output TBC file path
-        additional_params: Optional string with additional vhs-decode parameters
+    Copy a binary pipe to the console until EOF, prefixing each line. The
+    pipe is drained a chunk at a time and the complete lines in each chunk
+    are decoded and written together. Blank lines, and lines containing
+    skip, are dropped. If given, observe is called with each block of
+    decoded lines before it is written.
     """
-    # Clean up any existing vhs-decode processes first
-    try:
-        result = subprocess.run(['pgrep', '-f', 'vhs-decode'], capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
-            print(f"Found {len(pids)} existing vhs-decode process(es), terminating...")
-            for pid in pids:
-                if pid.strip():
-                    try:
-                        subprocess.run(['kill', pid.strip()], check=True)
-                        print(f"   Terminated PID: {pid}")
-                    except subprocess.CalledProcessError:
-                        print(f"   Warning: Could not terminate process {pid}")
-    except Exception as e:
-        print(f"Process cleanup warning: {e}")
+    def emit(text):
+        if observe is not None:
+            observe(text)
+        lines = [line.rstrip() for line in text.splitlines()]
+        out = ''.join(f"{prefix}{line}\n" for line in lines
+                      if line and (skip is None or skip not in line))
+        if out:
+            sys.stdout.write(out)
+            sys.stdout.flush()
     
-    # Check if vhs-decode is available
-    vhs_decode_path = check_command_available('vhs-decode')
-    if not vhs_decode_path:
-        print("ERROR: vhs-decode not found in system PATH")
-        print("Please install vhs-decode or ensure it's in your PATH")
-        print("Visit: https://github.com/oyvindln/vhs-decode")
-        return False
-    
-    print(f"Using vhs-decode: {vhs_decode_path}")
-    
-    # Build the vhs-decode command with the specified options
-    cmd = [
-        'vhs-decode',
-        '--tf', 'vhs',          # Format: VHS
-        '-t', '3',              # Threads: 3
-        '--ts', 'SP',           # Tape speed: SP (standard play)
-        '--pal',                # PAL format
-        '--no_resample',        # No resampling
-        '--recheck_phase',      # Recheck phase
-        '--ire0_adjust',        # IRE 0 adjust
-    ]
-    
-    # Add additional user parameters if provided
-    if additional_params and additional_params.strip():
-        # Split the additional parameters and add them to the command
-        extra_params = additional_params.strip().split()
-        cmd.extend(extra_params)
-        print(f"Adding user parameters: {' '.join(extra_params)}")
-    
-    # Add input and output files at the end
-    cmd.extend([
-        rf_filename,            # Input RF file
-        tbc_filename.replace('.tbc', '')  # Output base name (without extension)
-    ])
-    
-    print(f"Command: {' '.join(cmd)}")
-    print("This may take several minutes depending on capture length...")
-    
-    try:
-        # Use stdbuf to force unbuffered output from vhs-decode
-        # Add stdbuf -o0 to disable stdout buffering
-        unbuffered_cmd = ['stdbuf', '-o0'] + cmd
-        
-        # Try with stdbuf first, fall back to regular command if stdbuf not available
+    buf = bytearray()
+    while True:
+        chunk = pipe.read1(65536)
+        if not chunk:
+            break
+        buf += chunk
+        # Progress output may be terminated by \r as well as \n
+        end = max(buf.rfind(b'\n'), buf.rfind(b'\r')) + 1
+        if end:
+            emit(buf[:end].decode('utf-8', 'replace'))
+            del buf[:end]
+    if buf:
+        emit(buf.decode('utf-8', 'replace'))
+
+def _stream_subprocess(process, prefix='  ', skip=None, observe=None):
+    """
+    Relay a subprocess's output (opened in binary mode) to the console as it
+    arrives. stdout is relayed on this thread; a separate stderr pipe gets a
+    helper thread so neither pipe can fill up and stall the child.
+    Returns once both pipes reach EOF.
+    """
+    stderr_thread = None
+    if process.stderr is not None:
+        stderr_thread = threading.Thread(target=_relay_pipe, args=(process.stderr, prefix, skip),
+                                         daemon=True)
+        stderr_thread.start()
+    _relay_pipe(process.stdout, prefix, skip, observe)
+    if stderr_thread is not None:
+        stderr_thread.join()
+
+def _stop_process_group(process):
+    """
+    Stop a child started with start_new_session=True, together with anything
+    it spawned: SIGTERM to its process group, then SIGKILL if it has not
+    exited within 5 seconds. Windows has no process groups to signal, so
+    there only the child itself is stopped.
+    """
+    def signal_group(sig, fallback):
         try:
-            process = subprocess.Popen(unbuffered_cmd, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.STDOUT,
-                                     universal_newlines=True)
-        except FileNotFoundError:
-            # stdbuf not available, use regular command
-            process = subprocess.Popen(cmd, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.STDOUT,
-                                     universal_newlines=True)
-        
-        # Read output line by line in real-time
-        import sys
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                # Print immediately without buffering
-                print(f"  {output.rstrip()}", flush=True)
-        
-        rc = process.returncode
-        
-        if rc == 0:
-            print("vhs-decode completed successfully")
-            
-            # Verify output files exist
-            tbc_json_file = tbc_filename + '.json'
-            if os.path.exists(tbc_filename) and os.path.exists(tbc_json_file):
-                print(f"Created: {tbc_filename}")
-                print(f"Created: {tbc_json_file}")
-                return True
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, sig)
             else:
-                print("vhs-decode completed but expected output files not found")
-                return False
-        else:
-            print(f"vhs-decode failed with exit code {rc}")
-            return False
-            
-    except Exception as e:
-        print(f"Error running vhs-decode: {e}")
-        return False
+                fallback()
+        except ProcessLookupError:
+            pass
+    
+    signal_group(getattr(signal, 'SIGTERM', None), process.terminate)
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        signal_group(getattr(signal, 'SIGKILL', None), process.kill)
+        process.wait()
+
+# vhs-decode options that never change between runs
+_VHS_DECODE_FIXED_ARGS = (
+    'vhs-decode',
+    '--tf', 'vhs',          # Format: VHS
+    '-t', '3',              # Threads: 3
+    '--no_resample',        # No resampling
+    '--recheck_phase',      # Recheck phase
+    '--ire0_adjust',        # IRE 0 adjust
+)
+_VHS_DECODE_STANDARD_FLAGS = {'pal': '--pal', 'ntsc': '--ntsc'}
+
+def run_vhs_decode(rf_filename, tbc_filename, additional_params=None, cleanup_stale=False):
+    """
+    Run vhs-decode with PAL SP settings on the RF capture file
+    Returns True if successful, False otherwise
+    """
+    return run_vhs_decode_with_params(rf_filename, tbc_filename, 'pal', 'SP', additional_params,
+                                      cleanup_stale=cleanup_stale)
 
 
-def run_vhs_decode_ntsc(rf_filename, tbc_filename, additional_params=None):
+def run_vhs_decode_ntsc(rf_filename, tbc_filename, additional_params=None, cleanup_stale=False):
     """
-    Run vhs-decode with NTSC settings on the RF capture file
+    Run vhs-decode with NTSC SP settings on the RF capture file
     Returns True if successful, False otherwise
-    
-    Args:
-        rf_filename: Input RF (.lds) file path
-        tbc_filename: Output TBC file path
-        additional_params: Optional string with additional vhs-decode parameters
     """
-    # Clean up any existing vhs-decode processes first
-    try:
-        result = subprocess.run(['pgrep', '-f', 'vhs-decode'], capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
-            print(f"Found {len(pids)} existing vhs-decode process(es), terminating...")
-            for pid in pids:
-                if pid.strip():
-                    try:
-                        subprocess.run(['kill', pid.strip()], check=True)
-                        print(f"   Terminated PID: {pid}")
-                    except subprocess.CalledProcessError:
-                        print(f"   Warning: Could not terminate process {pid}")
-    except Exception as e:
-        print(f"Process cleanup warning: {e}")
-    
-    # Check if vhs-decode is available
-    vhs_decode_path = check_command_available('vhs-decode')
-    if not vhs_decode_path:
-        print("ERROR: vhs-decode not found in system PATH")
-        print("Please install vhs-decode or ensure it's in your PATH")
-        print("Visit: https://github.com/oyvindln/vhs-decode")
-        return False
-    
-    print(f"Using vhs-decode: {vhs_decode_path}")
-    
-    # Build the vhs-decode command with NTSC-specific options
-    cmd = [
-        'vhs-decode',
-        '--tf', 'vhs',          # Format: VHS
-        '-t', '3',              # Threads: 3
-        '--ts', 'SP',           # Tape speed: SP (standard play)
-        '--ntsc',               # NTSC format (different from PAL version)
-        '--no_resample',        # No resampling
-        '--recheck_phase',      # Recheck phase
-        '--ire0_adjust',        # IRE 0 adjust
-    ]
-    
-    # Add additional user parameters if provided
-    if additional_params and additional_params.strip():
-        # Split the additional parameters and add them to the command
-        extra_params = additional_params.strip().split()
-        cmd.extend(extra_params)
-        print(f"Adding user parameters: {' '.join(extra_params)}")
-    
-    # Add input and output files at the end
-    cmd.extend([
-        rf_filename,            # Input RF file
-        tbc_filename.replace('.tbc', '')  # Output base name (without extension)
-    ])
-    
-    print(f"Command: {' '.join(cmd)}")
-    print("This may take several minutes depending on capture length...")
-    
-    try:
-        # Use stdbuf to force unbuffered output from vhs-decode
-        # Add stdbuf -o0 to disable stdout buffering
-        unbuffered_cmd = ['stdbuf', '-o0'] + cmd
-        
-        # Try with stdbuf first, fall back to regular command if stdbuf not available
-        try:
-            process = subprocess.Popen(unbuffered_cmd, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.STDOUT,
-                                     universal_newlines=True)
-        except FileNotFoundError:
-            # stdbuf not available, use regular command
-            process = subprocess.Popen(cmd, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.STDOUT,
-                                     universal_newlines=True)
-        
-        # Read output line by line in real-time
-        import sys
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                # Print immediately without buffering
-                print(f"  {output.rstrip()}", flush=True)
-        
-        rc = process.returncode
-        
-        if rc == 0:
-            print("vhs-decode completed successfully")
-            
-            # Verify output files exist
-            tbc_json_file = tbc_filename + '.json'
-            if os.path.exists(tbc_filename) and os.path.exists(tbc_json_file):
-                print(f"Created: {tbc_filename}")
-                print(f"Created: {tbc_json_file}")
-                return True
-            else:
-                print("vhs-decode completed but expected output files not found")
-                return False
-        else:
-            print(f"vhs-decode failed with exit code {rc}")
-            return False
-            
-    except Exception as e:
-        print(f"Error running vhs-decode: {e}")
-        return False
+    return run_vhs_decode_with_params(rf_filename, tbc_filename, 'ntsc', 'SP', additional_params,
+                                      cleanup_stale=cleanup_stale)
 
 
-def run_vhs_decode_with_params(rf_filename, tbc_filename, video_standard, tape_speed, additional_params=None):
+def run_vhs_decode_with_params(rf_filename, tbc_filename, video_standard, tape_speed, additional_params=None,
+                               cleanup_stale=False):
     """
     Unified VHS decode function with configurable video standard and tape speed
     Returns True if successful, False otherwise
@@ -932,22 +1027,28 @@ def run_vhs_decode_with_params(rf_filename, tbc_filename, video_standard, tape_s
         video_standard: 'pal' or 'ntsc'
         tape_speed: 'SP', 'LP', or 'EP'
         additional_params: Optional string with additional vhs-decode parameters
+        cleanup_stale: Terminate any vhs-decode processes already running
+            first. Callers that run cleanup_existing_processes() themselves
+            (once, before a batch) leave this off.
     """
     # Clean up any existing vhs-decode processes first
-    try:
-        result = subprocess.run(['pgrep', '-f', 'vhs-decode'], capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
-            print(f"Found {len(pids)} existing vhs-decode process(es), terminating...")
-            for pid in pids:
-                if pid.strip():
-                    try:
-                        subprocess.run(['kill', pid.strip()], check=True)
+    if cleanup_stale:
+        try:
+            pids, = _find_processes('vhs-decode')
+            if pids:
+                print(f"Found {len(pids)} existing vhs-decode process(es), terminating...")
+                for pid in pids:
+                    if _terminate_process(pid):
                         print(f"   Terminated PID: {pid}")
-                    except subprocess.CalledProcessError:
+                    else:
                         print(f"   Warning: Could not terminate process {pid}")
-    except Exception as e:
-        print(f"Process cleanup warning: {e}")
+        except Exception as e:
+            print(f"Process cleanup warning: {e}")
+    
+    # vhs-decode takes the output base name (without extension) and adds
+    # .tbc / .tbc.json itself
+    tbc_base = tbc_filename[:-4] if tbc_filename.endswith('.tbc') else tbc_filename
+    tbc_filename = tbc_base + '.tbc'
     
     # Check if vhs-decode is available
     vhs_decode_path = check_command_available('vhs-decode')
@@ -959,78 +1060,59 @@ def run_vhs_decode_with_params(rf_filename, tbc_filename, video_standard, tape_s
     
     print(f"Using vhs-decode: {vhs_decode_path}")
     
-    # Build the vhs-decode command with configurable options
-    cmd = [
-        'vhs-decode',
-        '--tf', 'vhs',          # Format: VHS
-        '-t', '3',              # Threads: 3
-        '--ts', tape_speed,     # Tape speed: SP, LP, or EP
-        '--no_resample',        # No resampling
-        '--recheck_phase',      # Recheck phase
-        '--ire0_adjust',        # IRE 0 adjust
-    ]
-    
-    # Add video standard (PAL or NTSC)
-    if video_standard.lower() == 'pal':
-        cmd.append('--pal')
-    elif video_standard.lower() == 'ntsc':
-        cmd.append('--ntsc')
-    else:
+    # Pick the video standard flag (PAL or NTSC)
+    standard_flag = _VHS_DECODE_STANDARD_FLAGS.get(video_standard.lower())
+    if standard_flag is None:
         print(f"ERROR: Invalid video standard '{video_standard}'. Must be 'pal' or 'ntsc'.")
         return False
     
     # Add additional user parameters if provided
+    extra_params = []
     if additional_params and additional_params.strip():
         # Split the additional parameters and add them to the command
         extra_params = additional_params.strip().split()
-        cmd.extend(extra_params)
         print(f"Adding user parameters: {' '.join(extra_params)}")
     
-    # Add input and output files at the end
-    cmd.extend([
+    # Build the vhs-decode command, with input and output files at the end
+    cmd = [
+        *_VHS_DECODE_FIXED_ARGS,
+        '--ts', tape_speed,     # Tape speed: SP, LP, or EP
+        standard_flag,
+        *extra_params,
         rf_filename,            # Input RF file
-        tbc_filename.replace('.tbc', '')  # Output base name (without extension)
-    ])
+        tbc_base                # Output base name (without extension)
+    ]
     
     print(f"Command: {' '.join(cmd)}")
     print(f"This may take several minutes depending on capture length...")
     
     try:
-        # Use stdbuf to force unbuffered output from vhs-decode
-        # Add stdbuf -o0 to disable stdout buffering
-        unbuffered_cmd = ['stdbuf', '-o0'] + cmd
-        
-        # Try with stdbuf first, fall back to regular command if stdbuf not available
+        # vhs-decode is a Python program, so ask its interpreter not to
+        # buffer stdout; progress then reaches us as soon as it is printed
+        process = subprocess.Popen(cmd, 
+                                 stdout=subprocess.PIPE, 
+                                 stderr=subprocess.STDOUT,
+                                 env={**os.environ, 'PYTHONUNBUFFERED': '1'},
+                                 start_new_session=True)
+        
+        # Relay output in real-time
         try:
-            process = subprocess.Popen(unbuffered_cmd, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.STDOUT,
-                                     universal_newlines=True)
-        except FileNotFoundError:
-            # stdbuf not available, use regular command
-            process = subprocess.Popen(cmd, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.STDOUT,
-                                     universal_newlines=True)
-        
-        # Read output line by line in real-time
-        import sys
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                # Print immediately without buffering
-                print(f"  {output.rstrip()}", flush=True)
-        
-        rc = process.returncode
+            _stream_subprocess(process)
+            rc = process.wait()
+        except KeyboardInterrupt:
+            _stop_process_group(process)
+            raise
         
         if rc == 0:
             print(f"{video_standard.upper()} {tape_speed} vhs-decode completed successfully")
             
-            # Verify output files exist
+            # Verify output files exist; both live in the same directory, so
+            # one listing answers for the pair
             tbc_json_file = tbc_filename + '.json'
-            if os.path.exists(tbc_filename) and os.path.exists(tbc_json_file):
+            with os.scandir(os.path.dirname(tbc_filename) or '.') as it:
+                output_names = {entry.name for entry in it}
+            if (os.path.basename(tbc_filename) in output_names and
+                    os.path.basename(tbc_json_file) in output_names):
                 print(f"Created: {tbc_filename}")
                 print(f"Created: {tbc_json_file}")
                 return True
@@ -1046,10 +1128,15 @@ def run_vhs_decode_with_params(rf_filename, tbc_filename, video_standard, tape_s
         return False
 
 
-def run_tbc_video_export(tbc_filename, video_filename):
+def run_tbc_video_export(tbc_filename, video_filename, video_system='pal'):
     """
-    Run tbc-video-export to create FFV1 video file with PAL settings
+    Run tbc-video-export to create FFV1 video file
     Returns True if successful, False otherwise
+    
+    Args:
+        tbc_filename: Input TBC file path
+        video_filename: Output video file path
+        video_system: 'pal' or 'ntsc'
     """
     # Check if tbc-video-export is available
     tbc_export_path = check_command_available('tbc-video-export')
@@ -1061,10 +1148,10 @@ def run_tbc_video_export(tbc_filename, video_filename):
     
     print(f"Using tbc-video-export: {tbc_export_path}")
     
-    # Build the tbc-video-export command with PAL video system
+    # Build the tbc-video-export command with the requested video system
     cmd = [
         'tbc-video-export',
-        '--video-system', 'pal', # Force PAL video system
+        '--video-system', video_system, # Force PAL/NTSC video system
         tbc_filename,           # Input TBC file
         video_filename          # Output video file
     ]
@@ -1079,35 +1166,16 @@ def run_tbc_video_export(tbc_filename, video_filename):
                             stdout=subprocess.PIPE, 
                             stderr=subprocess.PIPE,
                             stdin=subprocess.DEVNULL,
-                            universal_newlines=True,
-                            bufsize=1) as process:
-            
-            # Capture output line by line from both stdout and stderr
-            import select
-            import io
-            
-            # Set up for non-blocking reads
-            stdout_lines = []
-            stderr_lines = []
-            
-            # Read all output
-            stdout, stderr = process.communicate()
-            
-            # Print stdout (normal output)
-            if stdout:
-                for line in stdout.splitlines():
-                    if line.strip():  # Skip empty lines
-                        print(f"  {line}")
-            
-            # Handle stderr - filter out the ioctl error but show other errors
-            if stderr:
-                for line in stderr.splitlines():
-                    line_stripped = line.strip()
-                    if line_stripped and "Inappropriate ioctl for device" not in line_stripped:
-                        print(f"  {line_stripped}")
-                    elif "Inappropriate ioctl for device" in line_stripped:
-                        # Just note this error but don't show it (it's non-fatal)
-                        pass
+                            start_new_session=True) as process:
+            
+            # Show output from both stdout and stderr as it arrives, filtering
+            # out the ioctl error (it's non-fatal)
+            try:
+                _stream_subprocess(process, skip="Inappropriate ioctl for device")
+                process.wait()
+            except KeyboardInterrupt:
+                _stop_process_group(process)
+                raise
             
             rc = process.returncode
         
@@ -1115,8 +1183,9 @@ def run_tbc_video_export(tbc_filename, video_filename):
             print("tbc-video-export completed successfully")
             
             # Verify output file exists
-            if os.path.exists(video_filename):
-                file_size = os.path.getsize(video_filename) / (1024**2)  # MB
+            st = _stat_or_none(video_filename)
+            if st is not None:
+                file_size = st.st_size / (1024**2)  # MB
                 print(f"Created: {video_filename} ({file_size:.1f} MB)")
                 return True
             else:
@@ -1136,84 +1205,7 @@ def run_tbc_video_export_ntsc(tbc_filename, video_filename):
     Run tbc-video-export to create FFV1 video file with NTSC settings
     Returns True if successful, False otherwise
     """
-    # Check if tbc-video-export is available
-    tbc_export_path = check_command_available('tbc-video-export')
-    if not tbc_export_path:
-        print("ERROR: tbc-video-export not found in system PATH")
-        print("Please install ld-decode tools or ensure tbc-video-export is in your PATH")
-        print("Visit: https://github.com/happycube/ld-decode")
-        return False
-    
-    print(f"Using tbc-video-export: {tbc_export_path}")
-    
-    # Build the tbc-video-export command with NTSC video system
-    cmd = [
-        'tbc-video-export',
-        '--video-system', 'ntsc', # Force NTSC video system
-        tbc_filename,           # Input TBC file
-        video_filename          # Output video file
-    ]
-    
-    print(f"Command: {' '.join(cmd)}")
-    print("Exporting video file...")
-    
-    try:
-        # Run with output capture that avoids terminal ioctl issues
-        # Use DEVNULL for stdin to prevent ioctl errors
-        with subprocess.Popen(cmd, 
-                            stdout=subprocess.PIPE, 
-                            stderr=subprocess.PIPE,
-                            stdin=subprocess.DEVNULL,
-                            universal_newlines=True,
-                            bufsize=1) as process:
-            
-            # Capture output line by line from both stdout and stderr
-            import select
-            import io
-            
-            # Set up for non-blocking reads
-            stdout_lines = []
-            stderr_lines = []
-            
-            # Read all output
-            stdout, stderr = process.communicate()
-            
-            # Print stdout (normal output)
-            if stdout:
-                for line in stdout.splitlines():
-                    if line.strip():  # Skip empty lines
-                        print(f"  {line}")
-            
-            # Handle stderr - filter out the ioctl error but show other errors
-            if stderr:
-                for line in stderr.splitlines():
-                    line_stripped = line.strip()
-                    if line_stripped and "Inappropriate ioctl for device" not in line_stripped:
-                        print(f"  {line_stripped}")
-                    elif "Inappropriate ioctl for device" in line_stripped:
-                        # Just note this error but don't show it (it's non-fatal)
-                        pass
-            
-            rc = process.returncode
-        
-        if rc == 0:
-            print("tbc-video-export completed successfully")
-            
-            # Verify output file exists
-            if os.path.exists(video_filename):
-                file_size = os.path.getsize(video_filename) / (1024**2)  # MB
-                print(f"Created: {video_filename} ({file_size:.1f} MB)")
-                return True
-            else:
-                print("tbc-video-export completed but output file not found")
-                return False
-        else:
-            print(f"tbc-video-export failed with exit code {rc}")
-            return False
-            
-    except Exception as e:
-        print(f"Error running tbc-video-export: {e}")
-        return False
+    return run_tbc_video_export(tbc_filename, video_filename, 'ntsc')
 
 
 def wait_for_file_ready(file_path, max_wait_seconds=30, check_interval=0.5):
@@ -1226,29 +1218,32 @@ def wait_for_file_ready(file_path, max_wait_seconds=30, check_interval=0.5):
     start_time = time.time()
     last_size = -1
     stable_count = 0
+    # While the file has not appeared yet, poll less and less often
+    missing_interval = check_interval
     
     while time.time() - start_time < max_wait_seconds:
-        if not os.path.exists(file_path):
+        try:
+            current_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             print(f"  File does not exist yet, waiting...")
-            time.sleep(check_interval)
+            time.sleep(missing_interval)
+            missing_interval = min(missing_interval * 2, 2.0)
             continue
-        
-        try:
-            current_size = os.path.getsize(file_path)
-            
-            # Check if file size is stable (indicates writing is complete)
-            if current_size == last_size and current_size > 0:
-                stable_count += 1
-                if stable_count >= 3:  # File size stable for 3 checks
-                    print(f"   File ready ({current_size} bytes)")
-                    return True
-            else:
-                stable_count = 0
-                last_size = current_size
-                print(f"  File size: {current_size} bytes (still growing)")
-            
         except (OSError, IOError) as e:
             print(f"  File access error: {e}")
+            time.sleep(check_interval)
+            continue
+        
+        # Check if file size is stable (indicates writing is complete)
+        if current_size == last_size and current_size > 0:
+            stable_count += 1
+            if stable_count >= 3:  # File size stable for 3 checks
+                print(f"   File ready ({current_size} bytes)")
+                return True
+        else:
+            stable_count = 0
+            last_size = current_size
+            print(f"  File size: {current_size} bytes (still growing)")
         
         time.sleep(check_interval)
     
@@ -1256,6 +1251,30 @@ def wait_for_file_ready(file_path, max_wait_seconds=30, check_interval=0.5):
     return False
 
 
+# Where the audio alignment script may live, relative to the project
+# directory (the one holding this file, not the current directory)
+_ALIGNMENT_SCRIPT_PATHS = (
+    'tools/audio-sync/vhs_audio_align.py',
+    'vhs_audio_align.py',
+    'tools/vhs_audio_align.py'
+)
+
+def _alignment_script_candidates():
+    """Absolute paths where the audio alignment script is looked for, in order"""
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    return [os.path.join(project_root, path) for path in _ALIGNMENT_SCRIPT_PATHS]
+
+# Timing reports printed by the alignment script: "offset: X.XXXs",
+# "delay: XXXms" and the like, or a note that no adjustment is needed
+_ALIGNMENT_RESULT_RE = re.compile(
+    r'(?P<kind>offset|delay):?\s*(?P<value>[+-]?\d+\.?\d*)\s*(?P<unit>s|ms|second|millisecond)'
+    r'|(?P<aligned>no adjustment|already aligned|no correction needed|perfectly aligned)',
+    re.IGNORECASE)
+
+# Result line printed by tools/simple_audio_analyzer.py
+_DETECTED_OFFSET_RE = re.compile(r'Detected timing offset:\s*([+-]?\d+\.?\d*)s')
+
+
 def analyze_alignment_with_tbc(audio_filename, tbc_json_filename):
     """
     Analyse audio alignment using TBC JSON timing data
@@ -1271,22 +1290,12 @@ def analyze_alignment_with_tbc(audio_filename, tbc_json_filename):
         return None
     
     # Look for the audio alignment script
-    alignment_script_paths = [
-        'tools/audio-sync/vhs_audio_align.py',
-        'vhs_audio_align.py',
-        'tools/vhs_audio_align.py'
-    ]
-    
-    alignment_script = None
-    for script_path in alignment_script_paths:
-        if os.path.exists(script_path):
-            alignment_script = script_path
-            break
-    
+    candidates = _alignment_script_candidates()
+    alignment_script = next((path for path in candidates if os.path.exists(path)), None)
     if not alignment_script:
         print("ERROR: vhs_audio_align.py script not found!")
         print("Looked in:")
-        for path in alignment_script_paths:
+        for path in candidates:
             print(f"   - {path}")
         print("\nPlease ensure the audio alignment script is available.")
         return None
@@ -1301,68 +1310,48 @@ def analyze_alignment_with_tbc(audio_filename, tbc_json_filename):
         # Generate aligned filename based on the input audio filename
         base_name = os.path.splitext(os.path.basename(audio_filename))[0]
         aligned_output = os.path.join(os.path.dirname(audio_filename), f"{base_name}_aligned.wav")
-        result = subprocess.run([
+        
+        # Show the script's output as it runs and pick the result out of it
+        # on the fly, rather than holding all of it until the script exits.
+        # The first timing report wins, as if the output were read line by line.
+        scan = {'match': None, 'success': False}
+        
+        def _scan(text):
+            if scan['match'] is None:
+                scan['match'] = _ALIGNMENT_RESULT_RE.search(text)
+            if 'Audio alignment completed successfully!' in text:
+                scan['success'] = True
+        
+        print("Script output:")
+        with subprocess.Popen([
             sys.executable, alignment_script, 
             audio_filename, tbc_json_filename, aligned_output
-        ], capture_output=True, text=True)  # No timeout - allow long-running alignment processes
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as process:  # No timeout - allow long-running alignment processes
+            _stream_subprocess(process, observe=_scan)
+            returncode = process.wait()
             
-        if result.returncode == 0:
+        if returncode == 0:
             print("Alignment analysis completed successfully")
-            print("Script output:")
-            print(result.stdout)
-            
-            # Parse the output to extract timing offset
-            output_lines = result.stdout.strip().split('\n')
-            
-            # Look for various timing offset patterns in the output
-            import re
             
             # Check if alignment was successful first
-            alignment_success = False
-            if 'Audio alignment completed successfully!' in result.stdout:
-                alignment_success = True
+            alignment_success = scan['success']
+            if alignment_success:
                 print("Audio alignment tool completed successfully")
             
             # Look for timing offset information in various formats
-            for line in output_lines:
-                line_lower = line.lower().strip()
+            match = scan['match']
+            if match and match.group('aligned'):
+                print("Audio appears to already be well aligned")
+                return 0.0
+            if match:
+                value = float(match.group('value'))
                 
-                # Pattern 1: "offset: X.XXXs" or "offset: XXXms"
-                offset_match = re.search(r'offset:?\s*([+-]?\d+\.?\d*)\s*(s|ms|second|millisecond)', line_lower)
-                if offset_match:
-                    try:
-                        offset_value = float(offset_match.group(1))
-                        unit = offset_match.group(2)
-                        
-                        # Convert to seconds if needed
-                        if unit in ['ms', 'millisecond']:
-                            offset_value = offset_value / 1000.0
-                        
-                        print(f"Detected timing offset: {offset_value:.3f}s")
-                        return offset_value
-                    except (ValueError, AttributeError) as e:
-                        print(f"Could not parse offset from line: {line}")
-                        continue
-                
-                # Pattern 2: Look for delay/timing information
-                delay_match = re.search(r'delay:?\s*([+-]?\d+\.?\d*)\s*(s|ms|second|millisecond)', line_lower)
-                if delay_match:
-                    try:
-                        delay_value = float(delay_match.group(1))
-                        unit = delay_match.group(2)
-                        
-                        if unit in ['ms', 'millisecond']:
-                            delay_value = delay_value / 1000.0
-                        
-                        print(f"Detected timing delay: {delay_value:.3f}s")
-                        return delay_value
-                    except (ValueError, AttributeError) as e:
-                        continue
+                # Convert to seconds if needed
+                if match.group('unit').lower() in ('ms', 'millisecond'):
+                    value = value / 1000.0
                 
-                # Pattern 3: Check for "no adjustment needed" type messages
-                if any(phrase in line_lower for phrase in ['no adjustment', 'already aligned', 'no correction needed', 'perfectly aligned']):
-                    print("Audio appears to already be well aligned")
-                    return 0.0
+                print(f"Detected timing {match.group('kind').lower()}: {value:.3f}s")
+                return value
             
             # If alignment was successful, return the aligned audio file path
             if alignment_success and os.path.exists(aligned_output):
@@ -1374,11 +1363,8 @@ def analyze_alignment_with_tbc(audio_filename, tbc_json_filename):
             return None
             
         else:
-            print(f"Alignment analysis failed (exit code {result.returncode})")
-            print("Error output:")
-            print(result.stderr)
-            print("Standard output:")
-            print(result.stdout)
+            print(f"Alignment analysis failed (exit code {returncode})")
+            print("See the script output above for details")
             return None
             
     except subprocess.TimeoutExpired:
@@ -1411,19 +1397,13 @@ def analyze_alignment_capture(capture_filename):
         ], capture_output=True, text=True, timeout=60)
         
         if result.returncode == 0:
-            # Parse the output to extract the offset
-            output_lines = result.stdout.strip().split('\n')
-            for line in output_lines:
-                if 'Detected timing offset:' in line:
-                    # Extract offset value
-                    try:
-                        offset_str = line.split('Detected timing offset:')[1].split('s')[0].strip()
-                        offset = float(offset_str)
-                        print(f"Analysis complete: {offset:.3f}s offset detected")
-                        return offset
-                    except (IndexError, ValueError) as e:
-                        print(f"Error parsing analysis result: {e}")
-                        break
+            # Parse the output to extract the offset - the whole output is
+            # searched in one go rather than split up into lines first
+            match = _DETECTED_OFFSET_RE.search(result.stdout)
+            if match:
+                offset = float(match.group(1))
+                print(f"Analysis complete: {offset:.3f}s offset detected")
+                return offset
             
             # If we get here, analysis completed but no offset was found
             print("Analysis completed but could not detect timing pattern")
@@ -1493,8 +1473,7 @@ def manual_calibration_entry():
     print("calibration measurements or external timing analysis.")
     
     # Load current delay from config
-    config = load_config()
-    current_delay = config.get('audio_delay', 0.000)
+    current_delay = get_audio_delay()
     print(f"\nCurrent delay in config: {current_delay:.3f}s")
     
     while True:
@@ -1559,6 +1538,15 @@ def manual_calibration_entry():
             break
 
 
+# Delay values written into the script itself:
+# audio_delay = X.XX in start_capture_and_record function
+_CAPTURE_DELAY_RE = re.compile(
+    r'(audio_delay = )([0-9]+\.[0-9]+)(\s*#\s*Calibrated delay for audio/video synchronization)')
+# time.sleep(X.XX) in perform_av_alignment function (alignment baseline)
+_ALIGNMENT_BASELINE_RE = re.compile(
+    r'(time\.sleep\()([0-9]+\.[0-9]+)(\)\s*#\s*Calibration baseline - no delay for measurement)')
+
+
 def update_script_delay_values(new_delay):
     """
     Update the delay values in the script file (both capture and alignment)
@@ -1571,37 +1559,33 @@ def update_script_delay_values(new_delay):
         with open(script_file, 'r') as f:
             content = f.read()
         
-        # Find and replace the delay values
-        import re
-        
-        # Pattern 1: audio_delay = X.XX in start_capture_and_record function  
-        pattern1 = r'(audio_delay = )([0-9]+\.[0-9]+)(\s*#\s*Calibrated delay for audio/video synchronization)'
-        
-        # Pattern 2: time.sleep(X.XX) in perform_av_alignment function (alignment baseline)
-        pattern2 = r'(time\.sleep\()([0-9]+\.[0-9]+)(\)\s*#\s*Calibration baseline - no delay for measurement)'
-        
         # Apply replacements
         new_content = content
         
         # Replace main capture delay
-        matches1 = re.findall(pattern1, new_content)
-        if matches1:
-            old_delay = float(matches1[0][1])
-            new_content = re.sub(pattern1, f'\\1{new_delay:.3f}\\3', new_content)
+        match1 = _CAPTURE_DELAY_RE.search(new_content)
+        if match1:
+            old_delay = float(match1.group(2))
+            new_content = _CAPTURE_DELAY_RE.sub(f'\\g<1>{new_delay:.3f}\\3', new_content)
             print(f"   Updated main capture delay: {old_delay:.3f}s → {new_delay:.3f}s")
         else:
             print("   Warning: Could not find main capture delay to update")
         
         # Keep alignment baseline at 0.0 (for measurement accuracy)
         alignment_delay = 0.0
-        matches2 = re.findall(pattern2, new_content)
-        if matches2:
-            new_content = re.sub(pattern2, f'\\1{alignment_delay:.3f}\\3', new_content)
+        if _ALIGNMENT_BASELINE_RE.search(new_content):
+            new_content = _ALIGNMENT_BASELINE_RE.sub(f'\\g<1>{alignment_delay:.3f}\\3', new_content)
             print(f"   Alignment baseline kept at: {alignment_delay:.3f}s")
         
-        # Write the updated content back
-        with open(script_file, 'w') as f:
-            f.write(new_content)
+        # Write the updated content back, if anything changed. It goes to a
+        # temporary file that is renamed into place, so a crash never leaves
+        # a half-written script behind; copystat keeps the script executable.
+        if new_content != content:
+            tmp_file = script_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(new_content)
+            shutil.copystat(script_file, tmp_file)
+            os.replace(tmp_file, script_file)
         
         return True
         
@@ -1637,6 +1621,22 @@ def update_capture_delay_only(new_delay):
         return False
 
 
+def _probe_fps(video_file):
+    """
+    Return the frame rate of the first video stream in video_file as reported
+    by ffprobe, or None if it cannot be determined
+    """
+    try:
+        result = subprocess.run([
+            'ffprobe', '-v', '0', '-select_streams', 'v:0',
+            '-show_entries', 'stream=r_frame_rate', '-of', 'csv=p=0', video_file
+        ], capture_output=True, text=True, stdin=subprocess.DEVNULL, timeout=10)
+        fps_num, fps_den = map(int, result.stdout.strip().split('/'))
+        return fps_num / fps_den if fps_num > 0 else None
+    except (OSError, subprocess.TimeoutExpired, ValueError, ZeroDivisionError):
+        return None
+
+
 def validate_calibration_with_configured_delay():
     """
     Validate calibration results by capturing with configured delay and measuring offset.
@@ -1694,58 +1694,107 @@ def validate_calibration_with_configured_delay():
         input("Configure DomesdayDuplicator output location and filename as shown above, then insert your VHS tape into your VCR and press play. It's very important to be playing this alignment tape before validation. Press any key to start Validation Capture.")
 
         # Read configured delay
-        config = load_config()
-        audio_delay = config.get('audio_delay', 0.000)
+        audio_delay = get_audio_delay()
         
         # Start debug log
-        debug_log = []
-        debug_log.append(f"=== CALIBRATION VALIDATION DEBUG LOG ===")
-        debug_log.append(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-        debug_log.append(f"Configured delay: {audio_delay:.6f}s")
-        debug_log.append(f"Capture duration: {alignment_duration_seconds}s")
-        debug_log.append(f"Base filename: {validation_base_name}")
-        debug_log.append("")
+        debug_log = io.StringIO()
+        print(f"=== CALIBRATION VALIDATION DEBUG LOG ===", file=debug_log)
+        print(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}", file=debug_log)
+        print(f"Configured delay: {audio_delay:.6f}s", file=debug_log)
+        print(f"Capture duration: {alignment_duration_seconds}s", file=debug_log)
+        print(f"Base filename: {validation_base_name}", file=debug_log)
+        print(file=debug_log)
 
         # Capture validation using command line DomesdayDuplicator
         print("\nStarting RF + Audio capture with configured delay...")
         validation_sox_command = get_sox_command(validation_capture_filename)
 
         try:
-            # 1. Start audio capture using command line
+            # 1. Start audio capture using command line, the configured delay
+            # after video is started - as shared_capture_process does for real
+            # captures. The delay is measured from a fixed deadline on its own
+            # thread, so the time spent starting DomesdayDuplicator does not
+            # add to it.
             print(f"Starting SOX audio recording with {audio_delay:.3f}s delay...")
-            time.sleep(audio_delay)  # Apply configured delay
-            validation_sox_command = get_sox_command(validation_capture_filename)
-            capture_process = subprocess.Popen(validation_sox_command)
-            print("SOX audio recording started")
-            debug_log.append(f"Audio capture started at: {time.strftime('%H:%M:%S')} (after {audio_delay:.3f}s delay)")
-            debug_log.append(f"Net timing: Audio started {audio_delay:.3f}s before video")
+            audio_start = time.monotonic() + audio_delay
+            sox_start = {}
+            
+            def _start_sox():
+                _sleep_until(audio_start)
+                try:
+                    sox_start['process'] = subprocess.Popen(validation_sox_command)
+                except Exception as e:
+                    sox_start['error'] = e
+            
+            sox_thread = threading.Thread(target=_start_sox)
+            sox_thread.start()
 
             # 2. Start video capture using command line
             print("Starting DomesdayDuplicator capture...")
-            ddd_process = subprocess.Popen(['DomesdayDuplicator', '--start-capture', '--headless'], 
-                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            try:
+                ddd_process = subprocess.Popen(['DomesdayDuplicator', '--start-capture', '--headless'], 
+                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            except BaseException:
+                # Don't leave SOX recording on its own
+                sox_thread.join()
+                if 'process' in sox_start:
+                    sox_start['process'].terminate()
+                    sox_start['process'].wait()
+                raise
+            sox_thread.join()
+            
+            if 'error' in sox_start:
+                # DomesdayDuplicator is already capturing, so stop it before
+                # giving up rather than leave a headless capture running
+                print(f"ERROR: Could not start SOX audio recording: {sox_start['error']}")
+                print("Please ensure SOX is installed and available in your PATH")
+                print("Stopping DomesdayDuplicator capture...")
+                _graceful_stop(ddd_process)
+                print("\nValidation capture cancelled.")
+                print(f"ERROR: SOX start failed: {sox_start['error']}", file=debug_log)
+                return
+            capture_process = sox_start['process']
+            print("SOX audio recording started")
+            print(f"Audio capture started at: {time.strftime('%H:%M:%S')} (after {audio_delay:.3f}s delay)", file=debug_log)
+            print(f"Net timing: Audio started {audio_delay:.3f}s after video", file=debug_log)
 
             # Check if process is still running (successful start)
             if ddd_process.poll() is None:
                 print("DomesdayDuplicator capture started successfully")
-                debug_log.append(f"Video capture started at: {time.strftime('%H:%M:%S')} using command line")
+                print(f"Video capture started at: {time.strftime('%H:%M:%S')} using command line", file=debug_log)
                 
                 print("\nVALIDATION CAPTURE IN PROGRESS")
                 print(f"Using configured delay: {audio_delay:.3f}s")
                 print(f"Both RF and audio recording for {alignment_duration_seconds} seconds...")
                 print("DO NOT STOP THE VCR YET - let it continue playing!")
                 
-                # Show progress during capture
+                # Show progress during capture. The main thread sleeps through
+                # the whole capture while a helper thread prints progress every
+                # 5 seconds, one dot per second that has passed in between.
                 print("Progress: ", end="", flush=True)
-                for i in range(alignment_duration_seconds):
-                    time.sleep(1)
-                    if (i + 1) % 5 == 0:  # Show progress every 5 seconds
-                        remaining = alignment_duration_seconds - (i + 1)
-                        print(f"{i+1}s ", end="", flush=True)
-                        if remaining > 0 and (i + 1) % 10 == 0:
+                progress_start = time.monotonic()
+                stop_progress = threading.Event()
+                
+                def _show_progress():
+                    elapsed = 5
+                    while elapsed <= alignment_duration_seconds:
+                        if stop_progress.wait(timeout=progress_start + elapsed - time.monotonic()):
+                            return
+                        remaining = alignment_duration_seconds - elapsed
+                        print(f"....{elapsed}s ", end="", flush=True)
+                        if remaining > 0 and elapsed % 10 == 0:
                             print(f"({remaining}s remaining) ", end="", flush=True)
-                    else:
-                        print(".", end="", flush=True)
+                        elapsed += 5
+                
+                progress_thread = threading.Thread(target=_show_progress, daemon=True)
+                progress_thread.start()
+                try:
+                    time.sleep(alignment_duration_seconds)
+                    # The last progress tick is due by now; let it print
+                    progress_thread.join()
+                finally:
+                    stop_progress.set()
+                print("." * (alignment_duration_seconds % 5), end="", flush=True)
                 
                 # 2. Stop audio recording
                 print("\nStopping audio recording...")
@@ -1753,7 +1802,7 @@ def validate_calibration_with_configured_delay():
                 capture_process.wait()
                 print("Audio recording stopped")
                 
-                debug_log.append(f"Audio capture stopped at: {time.strftime('%H:%M:%S')}")
+                print(f"Audio capture stopped at: {time.strftime('%H:%M:%S')}", file=debug_log)
 
                 # 3. Stop video capture using command line
                 print("\nStopping DomesdayDuplicator capture...")
@@ -1762,11 +1811,11 @@ def validate_calibration_with_configured_delay():
                 
                 if stop_result.returncode == 0:
                     print("DomesdayDuplicator capture stopped successfully")
-                    debug_log.append(f"Video capture stopped at: {time.strftime('%H:%M:%S')} using command line")
+                    print(f"Video capture stopped at: {time.strftime('%H:%M:%S')} using command line", file=debug_log)
                 else:
                     print(f"Warning: DomesdayDuplicator stop returned code {stop_result.returncode}")
                     print("Please verify capture was stopped properly")
-                    debug_log.append(f"Video capture stop warning: return code {stop_result.returncode}")
+                    print(f"Video capture stop warning: return code {stop_result.returncode}", file=debug_log)
                 
                 # Important user message after capture stops
                 print("\n" + "="*50)
@@ -1797,47 +1846,46 @@ def validate_calibration_with_configured_delay():
                 print("2. The hardware is connected properly")
                 print("3. No other instance is already running")
                 print("\nValidation capture cancelled.")
-                debug_log.append(f"ERROR: DomesdayDuplicator start failed with code {return_code}")
+                print(f"ERROR: DomesdayDuplicator start failed with code {return_code}", file=debug_log)
                 return
 
         except subprocess.TimeoutExpired:
             print("ERROR: DomesdayDuplicator command timed out")
             print("This might indicate the command is hanging or waiting for user input")
-            debug_log.append("ERROR: DomesdayDuplicator command timed out")
+            print("ERROR: DomesdayDuplicator command timed out", file=debug_log)
             return
         except FileNotFoundError:
             print("ERROR: DomesdayDuplicator command not found!")
             print("Please ensure DomesdayDuplicator is installed and available in your PATH")
-            debug_log.append("ERROR: DomesdayDuplicator command not found")
+            print("ERROR: DomesdayDuplicator command not found", file=debug_log)
             return
         except Exception as e:
             print(f"Capture error: {e}")
-            debug_log.append(f"Capture error: {e}")
+            print(f"Capture error: {e}", file=debug_log)
             return
 
         # 5. RF Decode step
         print("\nSTARTING RF DECODE WORKFLOW")
-        debug_log.append("=== RF DECODE PHASE ===")
-        debug_log.append(f"RF decode started at: {time.strftime('%H:%M:%S')}")
+        print("=== RF DECODE PHASE ===", file=debug_log)
+        print(f"RF decode started at: {time.strftime('%H:%M:%S')}", file=debug_log)
         print("Looking for RF capture file in temp folder...")
         
         # Find the most recent .lds file (RF capture) in temp folder
         if not os.path.exists(temp_folder):
             print(f"Temp folder {temp_folder} does not exist!")
-            debug_log.append(f"ERROR: Temp folder {temp_folder} does not exist")
+            print(f"ERROR: Temp folder {temp_folder} does not exist", file=debug_log)
             return
             
-        lds_files = [f for f in os.listdir(temp_folder) if f.endswith('.lds')]
-        if not lds_files:
+        # Get the most recent RF file (with full path)
+        rf_entry = _newest_entry(temp_folder, lambda name: name.endswith('.lds'))
+        if rf_entry is None:
             print(f"No RF capture files (.lds) found in {temp_folder}!")
-            debug_log.append(f"ERROR: No RF capture files found in {temp_folder}")
+            print(f"ERROR: No RF capture files found in {temp_folder}", file=debug_log)
             return
+        rf_file = rf_entry.path
         
-        # Get the most recent RF file (with full path)
-        lds_paths = [os.path.join(temp_folder, f) for f in lds_files]
-        rf_file = max(lds_paths, key=os.path.getmtime)
         print(f"Found RF capture: {rf_file}")
-        debug_log.append(f"RF file: {os.path.basename(rf_file)} ({os.path.getsize(rf_file) / (1024**2):.1f} MB)")
+        print(f"RF file: {rf_entry.name} ({rf_entry.stat().st_size / (1024**2):.1f} MB)", file=debug_log)
         
         # Check if we already have decoded files
         tbc_file = rf_file.replace('.lds', '.tbc')
@@ -1845,87 +1893,80 @@ def validate_calibration_with_configured_delay():
         
         if os.path.exists(tbc_json_file):
             print(f"TBC JSON already exists: {tbc_json_file}")
-            debug_log.append(f"TBC JSON already exists: {os.path.basename(tbc_json_file)}")
+            print(f"TBC JSON already exists: {os.path.basename(tbc_json_file)}", file=debug_log)
         else:
             print("\nRunning vhs-decode...")
-            if not run_vhs_decode_with_params(rf_file, tbc_file, 'pal', 'SP'):
+            if not run_vhs_decode_with_params(rf_file, tbc_file, 'pal', 'SP', cleanup_stale=True):
                 print("RF decode failed")
-                debug_log.append("ERROR: RF decode failed")
+                print("ERROR: RF decode failed", file=debug_log)
                 return
-            debug_log.append(f"RF decode completed: {os.path.basename(tbc_file)}")
+            print(f"RF decode completed: {os.path.basename(tbc_file)}", file=debug_log)
         
         # Check if we need to export video
         video_file = rf_file.replace('.lds', '_ffv1.mkv')
-        if os.path.exists(video_file):
+        # run_tbc_video_export checks the output exists before reporting success
+        have_video = os.path.exists(video_file)
+        if have_video:
             print(f"Video export already exists: {video_file}")
-            debug_log.append(f"Video export already exists: {os.path.basename(video_file)}")
+            print(f"Video export already exists: {os.path.basename(video_file)}", file=debug_log)
         else:
             print("\nRunning tbc-video-export...")
-            if not run_tbc_video_export(tbc_file, video_file):
+            have_video = run_tbc_video_export(tbc_file, video_file)
+            if not have_video:
                 print("Video export failed, but continuing with audio alignment...")
-                debug_log.append("WARNING: Video export failed")
+                print("WARNING: Video export failed", file=debug_log)
             else:
-                debug_log.append(f"Video export completed: {os.path.basename(video_file)}")
+                print(f"Video export completed: {os.path.basename(video_file)}", file=debug_log)
         
         print("\nRF decode workflow complete!")
-        debug_log.append("RF decode workflow completed")
-        debug_log.append("")
+        print("RF decode workflow completed", file=debug_log)
+        print(file=debug_log)
         
         # 6. Audio alignment analysis
         print(f"\nUsing TBC JSON file: {tbc_json_file}")
-        debug_log.append("=== AUDIO ALIGNMENT PHASE ===")
-        debug_log.append(f"Audio alignment started at: {time.strftime('%H:%M:%S')}")
-        debug_log.append(f"TBC JSON: {os.path.basename(tbc_json_file)}")
+        print("=== AUDIO ALIGNMENT PHASE ===", file=debug_log)
+        print(f"Audio alignment started at: {time.strftime('%H:%M:%S')}", file=debug_log)
+        print(f"TBC JSON: {os.path.basename(tbc_json_file)}", file=debug_log)
         
         print("\nRunning VHS mechanical audio alignment...")
         aligned_audio_file = analyze_alignment_with_tbc(validation_capture_filename, tbc_json_file)
         
-        # Wait for aligned file to be fully created
-        if aligned_audio_file and aligned_audio_file.endswith('_aligned.wav'):
-            print(f"Waiting for aligned audio file to be ready: {aligned_audio_file}")
-            wait_for_file_ready(aligned_audio_file, max_wait_seconds=30)
-        
-        if aligned_audio_file and os.path.exists(aligned_audio_file):
+        # The alignment script has exited by the time it hands back the
+        # aligned file, so the file is already complete - no need to wait
+        # for it to settle
+        aligned_stat = _stat_or_none(aligned_audio_file) if aligned_audio_file else None
+        if aligned_stat:
             print(f"\nMechanical alignment completed: {aligned_audio_file}")
-            debug_log.append(f"Aligned audio file created: {os.path.basename(aligned_audio_file)}")
+            print(f"Aligned audio file created: {os.path.basename(aligned_audio_file)}", file=debug_log)
             
             # Verify we're using the aligned file (debug info)
             if aligned_audio_file.endswith('_aligned.wav'):
                 print(f"CONFIRMED: Using aligned audio file for analysis")
-                debug_log.append("Using aligned audio file for test pattern analysis")
+                print("Using aligned audio file for test pattern analysis", file=debug_log)
             else:
                 print(f"WARNING: Not using aligned audio file - using: {aligned_audio_file}")
-                debug_log.append(f"WARNING: Not using aligned audio file - using: {os.path.basename(aligned_audio_file)}")
+                print(f"WARNING: Not using aligned audio file - using: {os.path.basename(aligned_audio_file)}", file=debug_log)
             
             # Show file details for verification
-            file_size = os.path.getsize(aligned_audio_file) / (1024*1024)  # MB
-            file_time = time.ctime(os.path.getmtime(aligned_audio_file))
+            file_size = aligned_stat.st_size / (1024*1024)  # MB
+            file_time = time.ctime(aligned_stat.st_mtime)
             print(f"   File size: {file_size:.1f} MB")
             print(f"   Modified: {file_time}")
-            debug_log.append(f"Aligned audio file size: {file_size:.1f} MB")
+            print(f"Aligned audio file size: {file_size:.1f} MB", file=debug_log)
             
             # Now run test pattern timing analysis on both aligned audio and video
             print("\nRunning test pattern timing analysis...")
-            debug_log.append("")
-            debug_log.append("=== TEST PATTERN TIMING ANALYSIS ===")
-            debug_log.append(f"Test pattern analysis started at: {time.strftime('%H:%M:%S')}")
+            print(file=debug_log)
+            print("=== TEST PATTERN TIMING ANALYSIS ===", file=debug_log)
+            print(f"Test pattern analysis started at: {time.strftime('%H:%M:%S')}", file=debug_log)
             
             offset_seconds = analyze_test_pattern_timing(aligned_audio_file, video_file)
             
             if offset_seconds is not None:
                 # Calculate frame offset for better understanding
                 fps = 25.0  # Default PAL
-                try:
-                    if os.path.exists(video_file):
-                        import cv2
-                        cap = cv2.VideoCapture(video_file)
-                        if cap.isOpened():
-                            detected_fps = cap.get(cv2.CAP_PROP_FPS)
-                            if detected_fps > 0:
-                                fps = detected_fps
-                            cap.release()
-                except:
-                    pass
+                if have_video:
+                    fps = _probe_fps(video_file) or fps
                 
                 frame_offset = offset_seconds * fps
                 
@@ -1937,8 +1978,8 @@ def validate_calibration_with_configured_delay():
                 print(f"   Configured delay used: {audio_delay:.6f} seconds")
                 print(f"   Expected result: ~0.000s if calibration is accurate")
                 
-                debug_log.append(f"Measured offset: {offset_seconds:+.6f} seconds")
-                debug_log.append(f"Configured delay: {audio_delay:.6f} seconds")
+                print(f"Measured offset: {offset_seconds:+.6f} seconds", file=debug_log)
+                print(f"Configured delay: {audio_delay:.6f} seconds", file=debug_log)
                 
                 # Analyze validation results
                 abs_offset = abs(offset_seconds)
@@ -1946,22 +1987,22 @@ def validate_calibration_with_configured_delay():
                     print(f"\nVALIDATION RESULT: EXCELLENT")
                     print(f"   Offset within ±10ms - calibration is highly accurate")
                     print(f"   Your current delay setting ({audio_delay:.3f}s) is working well")
-                    debug_log.append("VALIDATION RESULT: EXCELLENT (within ±10ms)")
+                    print("VALIDATION RESULT: EXCELLENT (within ±10ms)", file=debug_log)
                 elif abs_offset <= 0.050:  # Within 50ms
                     print(f"\nVALIDATION RESULT: GOOD")
                     print(f"   Offset within ±50ms - calibration is reasonably accurate")
                     print(f"   Consider fine-tuning if higher precision is needed")
-                    debug_log.append("VALIDATION RESULT: GOOD (within ±50ms)")
+                    print("VALIDATION RESULT: GOOD (within ±50ms)", file=debug_log)
                 elif abs_offset <= 0.100:  # Within 100ms
                     print(f"\nVALIDATION RESULT: FAIR")
                     print(f"   Offset within ±100ms - calibration may need adjustment")
                     print(f"   Consider running calibration again")
-                    debug_log.append("VALIDATION RESULT: FAIR (within ±100ms)")
+                    print("VALIDATION RESULT: FAIR (within ±100ms)", file=debug_log)
                 else:
                     print(f"\nVALIDATION RESULT: POOR")
                     print(f"   Offset > 100ms - calibration needs attention")
                     print(f"   Recommend running full calibration workflow again")
-                    debug_log.append("VALIDATION RESULT: POOR (>100ms offset)")
+                    print("VALIDATION RESULT: POOR (>100ms offset)", file=debug_log)
                 
                 if offset_seconds > 0:
                     # VALIDATION LOGIC: If audio is too late, we need to REDUCE the delay
@@ -1971,7 +2012,7 @@ def validate_calibration_with_configured_delay():
                     print(f"   Positive offset: Audio starts {offset_seconds:.3f}s too late")
                     print(f"   To improve: REDUCE audio delay to {suggested_delay:.3f}s")
                     print(f"   Logic: Current delay ({audio_delay:.3f}s) - measured offset ({offset_seconds:.3f}s)")
-                    debug_log.append(f"Recommendation: Reduce delay to {suggested_delay:.6f}s")
+                    print(f"Recommendation: Reduce delay to {suggested_delay:.6f}s", file=debug_log)
                 elif offset_seconds < 0:
                     # If audio is too early, we need to INCREASE the delay
                     suggested_delay = audio_delay + abs(offset_seconds)
@@ -1979,10 +2020,10 @@ def validate_calibration_with_configured_delay():
                     print(f"   Negative offset: Audio starts {abs(offset_seconds):.3f}s too early")
                     print(f"   To improve: INCREASE audio delay to {suggested_delay:.3f}s")
                     print(f"   Logic: Current delay ({audio_delay:.3f}s) + measured offset ({abs(offset_seconds):.3f}s)")
-                    debug_log.append(f"Recommendation: Increase delay to {suggested_delay:.6f}s")
+                    print(f"Recommendation: Increase delay to {suggested_delay:.6f}s", file=debug_log)
                 else:
                     print(f"\nPERFECT TIMING: Audio and video are perfectly synchronized!")
-                    debug_log.append("PERFECT TIMING: No adjustment needed")
+                    print("PERFECT TIMING: No adjustment needed", file=debug_log)
                 
                 print(f"\nDEBUG INFORMATION:")
                 print(f"   Debug log saved to: {os.path.basename(debug_filename)}")
@@ -1990,10 +2031,10 @@ def validate_calibration_with_configured_delay():
                 print(f"="*60)
                 
                 # Save debug log
-                debug_log.append("")
-                debug_log.append("=== VALIDATION COMPLETED ===")
-                debug_log.append(f"Validation completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                debug_log.append(f"Total analysis time: ~{alignment_duration_seconds + 300} seconds")
+                print(file=debug_log)
+                print("=== VALIDATION COMPLETED ===", file=debug_log)
+                print(f"Validation completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}", file=debug_log)
+                print(f"Total analysis time: ~{alignment_duration_seconds + 300} seconds", file=debug_log)
                 
             else:
                 print("\nTest pattern timing analysis failed")
@@ -2001,16 +2042,16 @@ def validate_calibration_with_configured_delay():
                 print("- Poor audio/video quality in capture")
                 print("- Missing test pattern signal")
                 print("- Test pattern not detected in video or audio")
-                debug_log.append("ERROR: Test pattern timing analysis failed")
+                print("ERROR: Test pattern timing analysis failed", file=debug_log)
         else:
             print("\nVHS mechanical audio alignment failed")
             print("Cannot proceed with test pattern analysis without aligned audio")
-            debug_log.append("ERROR: VHS mechanical audio alignment failed")
+            print("ERROR: VHS mechanical audio alignment failed", file=debug_log)
         
         # Write debug log to file
         try:
             with open(debug_filename, 'w') as f:
-                f.write('\n'.join(debug_log))
+                f.write(debug_log.getvalue())
             print(f"\nDebug log written to: {debug_filename}")
         except Exception as e:
             print(f"\nWarning: Could not write debug log: {e}")
@@ -2020,9 +2061,9 @@ def validate_calibration_with_configured_delay():
         print(f"   Audio: {os.path.basename(validation_capture_filename)}")
         print(f"   RF: {os.path.basename(rf_file)}")
         print(f"   TBC data: {os.path.basename(tbc_file)}")
-        if os.path.exists(aligned_audio_file):
+        if aligned_stat:
             print(f"   Aligned audio: {os.path.basename(aligned_audio_file)}")
-        if os.path.exists(video_file):
+        if have_video:
             print(f"   Video: {os.path.basename(video_file)}")
         print(f"   Debug log: {os.path.basename(debug_filename)}")
 
@@ -2115,16 +2156,17 @@ def prompt_for_capture_name(target_folder=None):
             lds_path = os.path.join(target_folder, f"{capture_name}.lds")
             flac_path = os.path.join(target_folder, f"{capture_name}.flac")
             
+            # Stat each candidate once; the result gives both existence and size
             existing_files = []
-            if os.path.exists(lds_path):
-                existing_files.append(lds_path)
-            if os.path.exists(flac_path):
-                existing_files.append(flac_path)
+            for file_path in (lds_path, flac_path):
+                st = _stat_or_none(file_path)
+                if st is not None:
+                    existing_files.append((file_path, st))
             
             if existing_files:
                 print(f"\nWARNING: Files with this name already exist:")
-                for file_path in existing_files:
-                    file_size = os.path.getsize(file_path) / (1024**2)  # MB
+                for file_path, st in existing_files:
+                    file_size = st.st_size / (1024**2)  # MB
                     print(f"   - {os.path.basename(file_path)} ({file_size:.1f} MB)")
                 
                 overwrite = input("\nOverwrite existing files? (y/N): ").strip().lower()
@@ -2170,8 +2212,7 @@ def start_capture_and_record():
         return  # User cancelled
     
     # Read calibrated audio delay from configuration
-    config = load_config()
-    audio_delay = config.get('audio_delay', 0.000)  # Default to 0.000 if not set
+    audio_delay = get_audio_delay()  # Default to 0.000 if not set
     print(f"Using configured audio delay: {audio_delay:.3f}s")
 
     # Construct output file path for both video and audio
@@ -2204,12 +2245,13 @@ def offer_wav_conversion(flac_file=None, wav_file=None):
     if wav_file is None:
         wav_file = CAPTURE_WAV_PATH
     
-    if not os.path.exists(flac_file):
+    flac_stat = _stat_or_none(flac_file)
+    if flac_stat is None:
         print(f"\nWarning: {flac_file} not found. Cannot offer conversion.")
         return
     
     # Estimate WAV file size (FLAC is typically 50-60% the size of WAV for this type of content)
-    flac_size = os.path.getsize(flac_file) / (1024**3)  # GB
+    flac_size = flac_stat.st_size / (1024**3)  # GB
     estimated_wav_size = flac_size * 1.8  # Rough estimate
     
     print(f"\n--- CAPTURE COMPLETE ---")
@@ -2295,17 +2337,29 @@ def rename_rf_files_to_match(desired_name, temp_folder):
     Returns True if successful, False otherwise
     """
     try:
-        # Find all .lds files in temp folder
-        lds_files = [f for f in os.listdir(temp_folder) if f.lower().endswith('.lds')]
+        # One pass over the folder finds the most recent .lds file (just
+        # created) and the most recent Domesday Duplicator JSON file, and
+        # notes which other files are there
+        newest = {'lds': None, 'json': None}
+        names = set()
+        with os.scandir(temp_folder) as it:
+            for entry in it:
+                names.add(entry.name)
+                name = entry.name.lower()
+                if name.endswith('.lds'):
+                    kind = 'lds'
+                elif name.endswith('.json') and not entry.name.endswith('.tbc.json'):
+                    kind = 'json'
+                else:
+                    continue
+                if newest[kind] is None or entry.stat().st_mtime > newest[kind].stat().st_mtime:
+                    newest[kind] = entry
         
-        if not lds_files:
+        most_recent_lds = newest['lds'] and newest['lds'].path
+        if most_recent_lds is None:
             print("No RF files (.lds) found to rename")
             return False
         
-        # Get the most recent .lds file (just created)
-        lds_paths = [os.path.join(temp_folder, f) for f in lds_files]
-        most_recent_lds = max(lds_paths, key=os.path.getmtime)
-        
         # Generate target filenames
         new_lds_name = os.path.join(temp_folder, f"{desired_name}.lds")
         new_json_name = os.path.join(temp_folder, f"{desired_name}.json")  # Direct JSON from Domesday Duplicator
@@ -2318,25 +2372,22 @@ def rename_rf_files_to_match(desired_name, temp_folder):
         
         # Find and rename the most recent JSON file (Domesday Duplicator format)
         # Look for files like "RF-Sample_YYYY-MM-DD_HH-MM-SS.json"
-        json_files = [f for f in os.listdir(temp_folder) if f.lower().endswith('.json') and not f.endswith('.tbc.json')]
-        if json_files:
-            json_paths = [os.path.join(temp_folder, f) for f in json_files]
-            most_recent_json = max(json_paths, key=os.path.getmtime)
-            
+        most_recent_json = newest['json'] and newest['json'].path
+        if most_recent_json is not None:
             if most_recent_json != new_json_name:
                 print(f"Renaming: {os.path.basename(most_recent_json)} → {desired_name}.json")
                 os.rename(most_recent_json, new_json_name)
         
         # Check for and rename associated TBC JSON file (from vhs-decode)
         old_tbc_json_file = most_recent_lds.replace('.lds', '.tbc.json')
-        if os.path.exists(old_tbc_json_file) and old_tbc_json_file != new_tbc_json_name:
+        if os.path.basename(old_tbc_json_file) in names and old_tbc_json_file != new_tbc_json_name:
             print(f"Renaming: {os.path.basename(old_tbc_json_file)} → {desired_name}.tbc.json")
             os.rename(old_tbc_json_file, new_tbc_json_name)
         
         # Check for and rename any other associated files (.tbc, etc.)
         old_tbc_file = most_recent_lds.replace('.lds', '.tbc')
         new_tbc_file = os.path.join(temp_folder, f"{desired_name}.tbc")
-        if os.path.exists(old_tbc_file) and old_tbc_file != new_tbc_file:
+        if os.path.basename(old_tbc_file) in names and old_tbc_file != new_tbc_file:
             print(f"Renaming: {os.path.basename(old_tbc_file)} → {desired_name}.tbc")
             os.rename(old_tbc_file, new_tbc_file)
         
@@ -2413,6 +2464,10 @@ def save_calibration_results(alignment_base_name, offset_seconds, delay_seconds,
         return False
 
 
+# Command lines of running sox / DomesdayDuplicator programs (bare name or full path)
+_SOX_PROCESS_PATTERN = r'(^|/)sox( |$)'
+_DDD_PROCESS_PATTERN = r'(^|/)DomesdayDuplicator( |$)'
+
 def stop_current_capture():
     """
     Stop any ongoing Domesday Duplicator and SOX captures.
@@ -2420,11 +2475,16 @@ def stop_current_capture():
     try:
         print("\n--- STOPPING CAPTURE ---")
         
-        # Stop SOX processes
-        try:
-            subprocess.run(['pkill', '-f', 'sox'], check=True)
+        # Stop SOX processes. The capture was started by another run of the
+        # tool, so there are no Popen handles to use - find them by command
+        # line instead, without spawning pkill. Only the programs themselves
+        # match, not every command line that happens to mention them.
+        sox_pids, = _find_processes(_SOX_PROCESS_PATTERN)
+        if sox_pids:
+            for pid in sox_pids:
+                _terminate_process(pid)
             print("SOX audio recording stopped.")
-        except subprocess.CalledProcessError:
+        else:
             print("No SOX processes found to stop.")
         
         # Stop DomesdayDuplicator using command line
@@ -2436,14 +2496,17 @@ def stop_current_capture():
             else:
                 print(f"DomesdayDuplicator stop returned code {stop_result.returncode}")
                 # Fallback to process kill
-                subprocess.run(['pkill', '-f', 'DomesdayDuplicator'], check=False)
+                for pid in _find_processes(_DDD_PROCESS_PATTERN)[0]:
+                    _terminate_process(pid)
                 print("Attempted to kill DomesdayDuplicator processes.")
         except (subprocess.TimeoutExpired, FileNotFoundError):
             print("Command line stop failed, trying process kill...")
-            try:
-                subprocess.run(['pkill', '-f', 'DomesdayDuplicator'], check=True)
+            ddd_pids, = _find_processes(_DDD_PROCESS_PATTERN)
+            if ddd_pids:
+                for pid in ddd_pids:
+                    _terminate_process(pid)
                 print("DomesdayDuplicator processes killed.")
-            except subprocess.CalledProcessError:
+            else:
                 print("No DomesdayDuplicator processes found to stop.")
                 
     except Exception as e:
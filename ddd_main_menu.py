@@ -3874,7 +3874,7 @@ def precision_timecode_capture():
         else:
             print("\nRunning vhs-decode...")
             from ddd_clockgen_sync import run_vhs_decode_with_params
-            if not run_vhs_decode_with_params(rf_file, tbc_file, 'pal', 'SP'):
+            if not run_vhs_decode_with_params(rf_file, tbc_file, 'pal', 'SP', cleanup_stale=True):
                 print("RF decode failed")
                 input("\nPress Enter to return to menu...")
                 return
@@ -47,7 +47,7 @@ def debug_timing_analysis():
     
     # Find video pattern starts  
     print("=== VIDEO ANALYSIS ===")
-    video_starts = find_all_video_pattern_starts(video_file)
+    video_starts, _ = find_all_video_pattern_starts(video_file)
     print(f"Video pattern starts: {len(video_starts)} detected")
     for i, start in enumerate(video_starts[:5]):  # Show first 5
         print(f"  Video pattern {i+1}: {start:.3f}s")
@@ -121,7 +121,7 @@ if __name__ == "__main__":
                 video_files = [f for f in os.listdir(temp_folder) if f.startswith("RF-Sample_") and f.endswith("_ffv1.mkv")]
                 if video_files:
                     video_file = os.path.join(temp_folder, sorted(video_files)[-1])
-                    video_starts = find_all_video_pattern_starts(video_file)
+                    video_starts, _ = find_all_video_pattern_starts(video_file)
                     
                     if video_starts and unaligned_audio_starts:
                         unaligned_offset = unaligned_audio_starts[0] - video_starts[0]